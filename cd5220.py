@@ -31,16 +31,145 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for test env
     )
 import time
 import logging
+import os
+import queue
 import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Union, Optional, Dict, Any, Tuple, List, Iterator
 from enum import Enum
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s %(levelname)-8s [CD5220] %(message)s',
-    datefmt='%H:%M:%S'
-)
 logger = logging.getLogger('CD5220')
+# Library default: emit nothing unless the application configures logging
+logger.addHandler(logging.NullHandler())
+_DEBUG_FORMAT = '%(asctime)s %(levelname)-8s [CD5220] %(message)s'
+# debug=True displays log through this child logger instead. Its level is
+# fixed at DEBUG, so the 'CD5220' logger's level and propagation stay exactly
+# as the application configured them, and records still reach its handlers.
+_debug_logger = logger.getChild('debug')
+_debug_logger.setLevel(logging.DEBUG)
+# Shared stderr handler, attached while any debug=True display without a
+# ring buffer is open
+_debug_lock = threading.Lock()
+_debug_handler: Optional[logging.Handler] = None
+_debug_handler_users = 0
+
+
+def _enable_debug_logging(handler: Optional[logging.Handler] = None) -> None:
+    """Send CD5220 debug output to ``handler`` for one display.
+
+    Without a handler the shared stderr handler is used, attached only once.
+    """
+    global _debug_handler, _debug_handler_users
+    with _debug_lock:
+        if handler is not None:
+            _debug_logger.addHandler(handler)
+            return
+        if _debug_handler_users == 0:
+            _debug_handler = logging.StreamHandler()
+            _debug_handler.setFormatter(logging.Formatter(_DEBUG_FORMAT, datefmt='%H:%M:%S'))
+            _debug_logger.addHandler(_debug_handler)
+        _debug_handler_users += 1
+
+
+def _disable_debug_logging(handler: Optional[logging.Handler] = None) -> None:
+    """Release one display's debug output, removing the stderr handler after the last."""
+    global _debug_handler, _debug_handler_users
+    with _debug_lock:
+        if handler is not None:
+            _debug_logger.removeHandler(handler)
+        elif _debug_handler_users:
+            _debug_handler_users -= 1
+            if _debug_handler_users == 0:
+                _debug_logger.removeHandler(_debug_handler)
+                _debug_handler = None
+
+
+# Maps every byte outside printable ASCII (0x20-0x7E) to '?', the only
+# characters the display is guaranteed to render
+_DISPLAY_BYTES_TABLE = bytes(b if 0x20 <= b <= 0x7E else 0x3F for b in range(256))
+
+# Two-digit upper-case hex for every byte value, used by the debug dump
+_HEX_TABLE = tuple('%02X' % b for b in range(256))
+
+
+def _to_display_bytes(text: Union[str, bytes]) -> bytes:
+    """Encode text for the display, replacing unsupported characters with '?'.
+
+    ``bytes`` input skips the encode step and is only mapped through the table.
+    """
+    if isinstance(text, str):
+        text = text.encode('ascii', 'replace')
+    return text.translate(_DISPLAY_BYTES_TABLE)
+
+
+@lru_cache(maxsize=256)
+def _string_command(prefix: bytes, text: Union[str, bytes], width: int) -> bytes:
+    """Build ``prefix`` + text truncated and space-padded to ``width`` bytes + CR.
+
+    Cached whole because labels and clock faces are redrawn with the same text.
+    """
+    return b''.join((prefix, _to_display_bytes(text)[:width].ljust(width), b'\x0D'))
+
+
+def _enable_low_latency(port: Any) -> bool:
+    """Ask a Linux serial port to send small writes without delay.
+
+    USB serial adapters otherwise hold small writes for their latency timer
+    (16ms on FTDI) before sending. pyserial's ``set_low_latency_mode`` sets
+    ASYNC_LOW_LATENCY; only where that is missing or rejected is the
+    adapter's sysfs ``latency_timer`` lowered instead. Returns whether either
+    was applied.
+    """
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        port.set_low_latency_mode(True)
+        return True
+    except (AttributeError, OSError, ValueError) as e:
+        logger.debug("set_low_latency_mode failed (%s), trying the sysfs latency timer", e)
+    if _set_latency_timer(port):
+        return True
+    logger.warning("Could not enable low-latency mode")
+    return False
+
+
+def _set_latency_timer(port: Any, ms: int = 1) -> bool:
+    """Lower a Linux USB serial adapter's sysfs latency timer to ``ms``."""
+    device = getattr(port, 'port', None)
+    if not isinstance(device, str):
+        logger.debug("No device path to find a latency timer for")
+        return False
+    name = os.path.basename(os.path.realpath(device))
+    path = f'/sys/bus/usb-serial/devices/{name}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write(str(ms))
+    except OSError as e:
+        # Includes FileNotFoundError: not a USB serial adapter with a timer
+        logger.debug("Could not set %s: %s", path, e)
+        return False
+    return True
+
+
+def _set_tx_buffer_size(port: Any, size: int) -> bool:
+    """Request a driver transmit buffer of ``size`` bytes where supported.
+
+    Only pyserial's Windows backend exposes ``set_buffer_size``; POSIX
+    drivers size their buffers themselves. Returns whether it was applied.
+    """
+    set_buffer_size = getattr(port, 'set_buffer_size', None)
+    if set_buffer_size is None:
+        return False
+    try:
+        set_buffer_size(tx_size=size)
+    except (OSError, ValueError, serial.SerialException) as e:
+        logger.warning("Could not set transmit buffer size: %s", e)
+        return False
+    return True
+
 
 class DisplayMode(Enum):
     """CD5220 operational modes."""
@@ -49,10 +178,42 @@ class DisplayMode(Enum):
     SCROLL = "scroll"
     VIEWPORT = "viewport"
 
+
+# Integer mode codes used internally so per-command mode checks are plain int
+# compares. NORMAL is 0, so a falsy code means normal mode.
+_MODE_NORMAL, _MODE_STRING, _MODE_SCROLL, _MODE_VIEWPORT = range(4)
+_MODES = (DisplayMode.NORMAL, DisplayMode.STRING, DisplayMode.SCROLL, DisplayMode.VIEWPORT)
+_MODE_CODES = {mode: code for code, mode in enumerate(_MODES)}
+
+
+class RingBufferHandler(logging.Handler):
+    """Keep the most recent log records in memory instead of writing them out.
+
+    Records are only formatted by ``dump()``, so high-rate debug logging costs
+    an append per record.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        super().__init__()
+        self.records: deque = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(_DEBUG_FORMAT, datefmt='%H:%M:%S'))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def dump(self, stream: Any = None) -> None:
+        """Write the buffered records to ``stream`` (stderr by default) and empty the buffer."""
+        stream = stream if stream is not None else sys.stderr
+        while self.records:
+            stream.write(self.format(self.records.popleft()) + "\n")
+        stream.flush()
+
+
 class CD5220DisplayError(Exception):
     """Custom exception for CD5220 display errors."""
     pass
 
+
 class CD5220:
     """
     CD5220 VFD Display Controller with Smart Mode Management
@@ -131,6 +292,18 @@ class CD5220:
     CMD_INTERNATIONAL_FONT = b'\x1B\x66'
     CMD_EXTENDED_FONT = b'\x1B\x63'
 
+    # Pre-encoded commands for the small, fixed argument spaces
+    _CURSOR_POSITION_CMDS: Dict[Tuple[int, int], bytes] = {}
+    for _row in (1, 2):
+        for _col in range(1, DISPLAY_WIDTH + 1):
+            _CURSOR_POSITION_CMDS[(_col, _row)] = CMD_CURSOR_POSITION + bytes((_col, _row))
+    _BRIGHTNESS_CMDS: Dict[int, bytes] = {}
+    for _level in range(1, 5):
+        _BRIGHTNESS_CMDS[_level] = CMD_BRIGHTNESS + bytes((_level,))
+    del _row, _col, _level
+    # Window commands are cached on first use, keyed by (op, start, end, line)
+    _WINDOW_CMDS: Dict[Tuple[int, int, int, int], bytes] = {}
+
     def __init__(self, serial_port: Union[str, serial.Serial, None] = None,
                  baudrate: int = 9600,
                  debug: bool = True,
@@ -143,14 +316,26 @@ class CD5220:
                  enable_simulator: bool = True,
                  hardware_enabled: bool = True,
                  render_console: bool = False,
-                 console_verbose: bool = False):
+                 console_verbose: bool = False,
+                 hw_drain: bool = False,
+                 background_writer: bool = False,
+                 write_timeout: Optional[float] = 1,
+                 tx_high_water: Optional[int] = None,
+                 low_latency: bool = False,
+                 debug_ring_size: int = 0,
+                 tx_buffer_size: Optional[int] = None):
         """
         Initialize CD5220 controller.
 
         Args:
             serial_port: Serial port device, existing Serial object, or ``None`` for simulator-only mode
             baudrate: Communication baud rate (default 9600)
-            debug: Enable debug logging
+            debug: Enable debug logging to stderr until ``close()``, through
+                the 'CD5220.debug' logger. Records still propagate to the
+                application's handlers as usual.
+                Otherwise the library logs through the 'CD5220' logger only as
+                the application configures, including per-command debug
+                records if it enables DEBUG on that logger before construction
             auto_clear_mode_transitions: Auto-clear when mode conflicts occur
             warn_on_mode_transitions: Log warnings for mode transitions
             base_command_delay: Base delay between commands (seconds, default 0.0)
@@ -161,35 +346,88 @@ class CD5220:
             render_console: Render simulator state to stdout after each command
             console_verbose: Show console output even when commands have no
                 visible effect
+            hw_drain: Block until the UART has drained after every write
+                (``Serial.flush``). Off by default; command pacing relies on
+                the configured delays instead.
+            background_writer: Hand serial writes and their delays to a
+                dedicated writer thread so calls return immediately. Use
+                ``wait_idle()`` when completion matters.
+            write_timeout: Serial write timeout in seconds when opening a port
+                by name (default 1, ``None`` blocks indefinitely)
+            tx_high_water: If set, wait before each write while more than this
+                many bytes are still queued in the OS transmit buffer, so a
+                stalled link delays the caller instead of timing out a write
+            low_latency: On Linux, set ASYNC_LOW_LATENCY on the port so USB
+                serial adapters send small writes immediately
+            debug_ring_size: With ``debug``, keep the last this-many debug
+                records in memory (``debug_ring``) instead of printing them,
+                and write them to stderr on ``close()``
+            tx_buffer_size: Ask the driver for a transmit buffer of this many
+                bytes so large batched writes do not stall. Only honoured
+                where pyserial supports it (Windows); ignored elsewhere
         """
+        # Set first so close() works however far construction gets
+        self.ser = None
         self.debug = debug
         self.auto_clear_mode_transitions = auto_clear_mode_transitions
         self.warn_on_mode_transitions = warn_on_mode_transitions
         self.base_command_delay = base_command_delay
         self.mode_transition_delay = mode_transition_delay
         self.initialization_delay = initialization_delay
+        self.hw_drain = hw_drain
+        self.baudrate = baudrate
+        self.tx_high_water = tx_high_water
+        # Background writer state, only used when background_writer=True
+        self._writer_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_error: Optional[Exception] = None
         self._render_console_enabled = render_console
         self.console_verbose = console_verbose
         self.simulator: Optional[DisplaySimulator] = DisplaySimulator() if enable_simulator or render_console else None
         self._first_console_render = True
         self._last_console_frame: Optional[Tuple[str, str]] = None
         self.hardware_enabled = False
-        self._current_mode = DisplayMode.NORMAL
+        self._mode = _MODE_NORMAL
         # The hardware supports only one active window configuration
         # at a time, tracked as (line, start_col, end_col)
         self._active_window: Optional[Tuple[int, int, int]] = None
         # Simulator cursor position tracking (1-based)
         self._sim_x = 1
         self._sim_y = 1
-
+        # Text last sent by write_positioned, keyed by (col, row). Entries are
+        # dropped whenever anything else may have changed those cells.
+        self._last_frame: Dict[Tuple[int, int], bytes] = {}
+        # Where the cursor would be had a skipped write_positioned been sent;
+        # restored in the same write as the next cursor-relative command
+        self._pending_cursor: Optional[Tuple[int, int]] = None
+        self._cursor_visible = False
+        # Text of the marquee currently scrolling, while in scroll mode
+        self._last_marquee: Optional[str] = None
+        # Last ESC Q A/B command sent per line; see _shown_string_lines()
+        self._string_lines: Dict[int, bytes] = {}
+        # Serial output collected inside batch(), with its longest delay
+        self._batch_buf: Optional[bytearray] = None
+        self._batch_delay = 0.0
+        self._batch_drain = False
+
+        self.debug_ring: Optional[RingBufferHandler] = None
+        self._log = _debug_logger if debug else logger
+        # Resolved once so the per-command hot path only tests a bool. Also
+        # true for debug=False when the application enables DEBUG itself
+        self._debug_enabled = self._log.isEnabledFor(logging.DEBUG)
+        self._debug_held = False
         if debug:
-            logger.setLevel(logging.DEBUG)
-            logger.debug("Initializing CD5220 controller")
+            if debug_ring_size:
+                self.debug_ring = RingBufferHandler(debug_ring_size)
+            _enable_debug_logging(self.debug_ring)
+            # Held until close()
+            self._debug_held = True
+            self._log.debug("Initializing CD5220 controller")
 
         try:
             if hardware_enabled and serial_port is not None:
                 if isinstance(serial_port, str):
-                    logger.debug(f"Opening serial port: {serial_port} at {baudrate} baud")
+                    self._log.debug("Opening serial port: %s at %s baud", serial_port, baudrate)
                     self.ser = serial.Serial(
                         port=serial_port,
                         baudrate=baudrate,
@@ -197,28 +435,43 @@ class CD5220:
                         parity='N',
                         stopbits=1,
                         timeout=1,
-                        write_timeout=1,
+                        write_timeout=write_timeout,
                     )
                 else:
-                    logger.debug("Using existing serial connection")
+                    self._log.debug("Using existing serial connection")
                     self.ser = serial_port
                 self.hardware_enabled = True
+                if low_latency:
+                    _enable_low_latency(self.ser)
+                if tx_buffer_size is not None:
+                    _set_tx_buffer_size(self.ser, tx_buffer_size)
                 time.sleep(0.1)
-                self._send_command(self.CMD_INITIALIZE, "Initialize display", self.initialization_delay)
-                self.restore_defaults()
-            else:
-                self.ser = None
-                if self.simulator:
-                    self._parse_and_apply_command(self.CMD_INITIALIZE)
-                    self._parse_and_apply_command(self.CMD_CLEAR)
+                self._init_sequence()
+                if background_writer:
+                    self._start_writer()
+            elif self.simulator:
+                self._parse_and_apply_command(self.CMD_INITIALIZE)
+                self._parse_and_apply_command(self.CMD_CLEAR)
 
         except (serial.SerialException, serial.SerialTimeoutException) as e:
-            logger.error(f"Serial connection failed: {e}")
+            self._log.error("Serial connection failed: %s", e)
             raise CD5220DisplayError(f"Serial connection failed: {e}")
         except Exception as e:
-            logger.error(f"Initialization failed: {e}")
+            self._log.error("Initialization failed: %s", e)
             raise CD5220DisplayError(f"Initialization failed: {e}")
 
+    @property
+    def ser(self) -> Optional[serial.Serial]:
+        """Underlying serial connection, or ``None`` without hardware."""
+        return self._ser
+
+    @ser.setter
+    def ser(self, port: Optional[serial.Serial]) -> None:
+        self._ser = port
+        # Bound once here so the per-command write path skips the lookups
+        self._ser_write = port.write if port is not None else None
+        self._ser_flush = port.flush if port is not None else None
+
     @classmethod
     def create_hardware_only(cls, port: str, **kwargs) -> "CD5220":
         """Factory for hardware-only operation."""
@@ -234,44 +487,232 @@ class CD5220:
         """Factory for hardware + simulator validation mode."""
         return cls(port, enable_simulator=True, hardware_enabled=True, **kwargs)
 
-    def _send_command(self, command: bytes, description: str = "Command", delay: float = None) -> None:
+    def _init_sequence(self) -> None:
+        """Reset the hardware, let it settle, then restore defaults in one write."""
+        # Commands arriving while ESC @ is still resetting the controller can be lost
+        self._send_command(self.CMD_INITIALIZE, "Initialize display", self.initialization_delay)
+        self._send_commands(
+            (
+                self.CMD_CLEAR,
+                self._BRIGHTNESS_CMDS[4],
+                self.CMD_OVERWRITE_MODE,
+                self.CMD_CURSOR_OFF,
+            ),
+            "Restore defaults",
+        )
+        self._mode = _MODE_NORMAL
+        self._active_window = None
+        self._cursor_visible = False
+        self._pending_cursor = None
+        self._sync_simulator_mode()
+
+    def _start_writer(self) -> None:
+        """Start the thread that owns all further serial writes."""
+        self._writer_queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="CD5220-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        """Write queued commands, coalescing back-to-back ones into one write."""
+        q = self._writer_queue
+        stop = False
+        while not stop:
+            item = q.get()
+            if item is None:
+                q.task_done()
+                break
+            chunks = [item[0]]
+            delay = item[1]
+            drain = item[2]
+            done = 1
+            # A command without a delay may share its write with the next one
+            while delay <= 0:
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+                done += 1
+                if item is None:
+                    stop = True
+                    break
+                chunks.append(item[0])
+                delay = item[1]
+                drain = drain or item[2]
+            try:
+                self._write_serial(chunks[0] if len(chunks) == 1 else b''.join(chunks), drain)
+                if delay > 0:
+                    time.sleep(delay)
+            except Exception as e:
+                # Any failure (e.g. OSError on unplug) is reported on the
+                # caller's thread; the writer keeps serving the queue
+                self._writer_error = e
+            finally:
+                for _ in range(done):
+                    q.task_done()
+
+    def _write_serial(self, data: bytes, drain: bool = False) -> None:
+        """Write bytes to the port, honouring ``tx_high_water`` and ``hw_drain``."""
+        if self.tx_high_water is not None:
+            waiting = self.ser.out_waiting
+            if waiting > self.tx_high_water:
+                # 10 bits per character on an 8N1 link
+                time.sleep(waiting * 10 / self.baudrate)
+        self._ser_write(data)
+        if drain or self.hw_drain:
+            self._ser_flush()
+
+    def _raise_writer_error(self) -> None:
+        """Surface a failure from the writer thread on the calling thread."""
+        error, self._writer_error = self._writer_error, None
+        if error is not None:
+            self._log.error("Command failed: %s", error)
+            raise CD5220DisplayError(f"Command failed: {error}")
+
+    def _check_writer_alive(self) -> None:
+        """Raise if the writer thread has exited, instead of queueing to nobody."""
+        if not self._writer_thread.is_alive():
+            self._raise_writer_error()
+            self._log.error("Background writer has stopped")
+            raise CD5220DisplayError("Background writer has stopped")
+
+    def wait_idle(self) -> None:
+        """Block until every queued command has been written and its delay elapsed."""
+        q = self._writer_queue
+        if q is None:
+            return
+        with q.all_tasks_done:
+            while q.unfinished_tasks:
+                if not self._writer_thread.is_alive():
+                    break
+                q.all_tasks_done.wait(0.1)
+        self._raise_writer_error()
+        self._check_writer_alive()
+
+    def _transmit(self, command: bytes, delay: float, drain: bool = False) -> float:
+        """Hand bytes to the writer thread or the port; return the delay still owed."""
+        if self._writer_queue is not None:
+            self._raise_writer_error()
+            self._check_writer_alive()
+            self._writer_queue.put((command, delay, drain))
+            return 0.0  # the writer thread owns the pacing
+        if self.hardware_enabled and self._ser_write is not None:
+            self._write_serial(command, drain)
+        return delay
+
+    @contextmanager
+    def batch(self) -> Iterator["CD5220"]:
+        """
+        Collect the commands issued inside the block and send them as one write.
+
+        The simulator is updated as each command is issued; serial output is
+        held until the outermost ``batch()`` exits. Per-command delays collapse
+        into a single wait for the longest of them after that write, so keep
+        commands that need settle time between them outside the batch.
+
+        Example:
+            with display.batch():
+                display.write_positioned("12", 1, 1)
+                display.write_positioned("34", 1, 2)
+        """
+        if self._batch_buf is not None:
+            yield self
+            return
+
+        self._batch_buf = bytearray()
+        self._batch_delay = 0.0
+        self._batch_drain = False
+        try:
+            yield self
+        finally:
+            data, self._batch_buf = bytes(self._batch_buf), None
+            if data:
+                if self._debug_enabled:
+                    self._log.debug("Sending batch: %d bytes | Delay: %.3fs", len(data), self._batch_delay)
+                try:
+                    delay = self._transmit(data, self._batch_delay, self._batch_drain)
+                except (serial.SerialException, serial.SerialTimeoutException) as e:
+                    self._log.error("Command failed: %s", e)
+                    raise CD5220DisplayError(f"Command failed: {e}")
+                if delay > 0:
+                    time.sleep(delay)
+
+    def _send_commands(self, commands: Tuple[bytes, ...], description: str = "Commands",
+                       delay: float = None, drain: bool = False,
+                       desc_args: Tuple[Any, ...] = ()) -> None:
+        """
+        Send several commands as one serial write followed by one delay.
+
+        The simulator still applies each command individually.
+        """
+        self._send_command(b''.join(commands), description, delay, parts=commands, drain=drain,
+                           desc_args=desc_args)
+
+    def _send_command(self, command: bytes, description: str = "Command", delay: float = None,
+                      parts: Optional[Tuple[bytes, ...]] = None, drain: bool = False,
+                      desc_args: Tuple[Any, ...] = ()) -> None:
         """
         Send command with optional delay override.
 
         Args:
             command: Command bytes to send
-            description: Debug description
-            delay: Override delay (None = use base_command_delay, 0.0 = no delay)
+            description: Debug description, a %-format string when ``desc_args`` is given
+            delay: Override delay (None = use base_command_delay, 0.0 = no delay),
+                measured from when the command was written
+            parts: Individual commands making up ``command``, for the simulator
+            drain: Wait for the UART to finish sending, even without ``hw_drain``
+            desc_args: Values for ``description``, formatted only if it is logged
+                or rendered
         """
         try:
             if delay is None:
                 delay = self.base_command_delay
 
-            hex_str = ' '.join(f'{byte:02X}' for byte in command)
-            logger.debug(f"Sending: {description} | Bytes: {hex_str} | Delay: {delay:.3f}s")
-
-            if self.hardware_enabled and self.ser:
-                self.ser.write(command)
-                self.ser.flush()
+            # Only pay for the hex dump when the record will actually be emitted
+            if self._debug_enabled:
+                if desc_args:
+                    description, desc_args = description % desc_args, ()
+                hex_str = ' '.join(map(_HEX_TABLE.__getitem__, command))
+                self._log.debug("Sending: %s | Bytes: %s | Delay: %.3fs", description, hex_str, delay)
+
+            if self._batch_buf is not None:
+                self._batch_buf += command
+                self._batch_delay = max(self._batch_delay, delay)
+                self._batch_drain = self._batch_drain or drain
+                delay = 0.0  # paid once when the batch is sent
+            else:
+                delay = self._transmit(command, delay, drain)
+            # The settle delay runs from the write, so simulator and console
+            # work below is absorbed by it rather than added to it
+            written_at = time.monotonic()
 
             if self.simulator:
                 before = self.simulator.get_display()
-                self._parse_and_apply_command(command)
+                if parts is None:
+                    self._parse_and_apply_command(command)
+                else:
+                    for part in parts:
+                        self._parse_and_apply_command(part)
                 after = self.simulator.get_display()
                 if self._render_console_enabled:
                     changed = before != after
+                    if desc_args:
+                        description = description % desc_args
                     self._render_console_state(description, changed)
 
             if delay > 0:
-                time.sleep(delay)
+                remaining = delay - (time.monotonic() - written_at)
+                if remaining > 0:
+                    time.sleep(remaining)
         except (serial.SerialException, serial.SerialTimeoutException) as e:
-            logger.error(f"Command failed: {e}")
+            self._log.error("Command failed: %s", e)
             raise CD5220DisplayError(f"Command failed: {e}")
 
     def _sync_simulator_mode(self) -> None:
         """Synchronize simulator mode with current hardware mode."""
         if self.simulator:
-            self.simulator.set_mode(self._current_mode)
+            self.simulator.set_mode(_MODES[self._mode])
             if self._active_window is None:
                 self.simulator.clear_window_state()
             else:
@@ -280,7 +721,16 @@ class CD5220:
     @property
     def current_mode(self) -> DisplayMode:
         """Get current display mode."""
-        return self._current_mode
+        return _MODES[self._mode]
+
+    @property
+    def _current_mode(self) -> DisplayMode:
+        """Enum view of ``_mode`` for code that reads or assigns it directly."""
+        return _MODES[self._mode]
+
+    @_current_mode.setter
+    def _current_mode(self, mode: DisplayMode) -> None:
+        self._mode = _MODE_CODES[mode]
 
     @property
     def active_window(self) -> Optional[Tuple[int, int, int]]:
@@ -296,7 +746,8 @@ class CD5220:
             'base_command_delay': self.base_command_delay,
             'mode_transition_delay': self.mode_transition_delay,
             'initialization_delay': self.initialization_delay,
-            'active_window': self.active_window
+            'active_window': self.active_window,
+            'baudrate': self.baudrate,
         }
 
     # ------------------------------------------------------------------
@@ -498,59 +949,157 @@ class CD5220:
 
     def _ensure_normal_mode(self, operation: str, force_clear: bool = False) -> bool:
         """Ensure display is in normal mode for operations that require it."""
-        if self._current_mode == DisplayMode.NORMAL:
+        if not self._mode:
             return False
+        return self._transition_to_normal(operation, force_clear)
+
+    def _transition_to_normal(self, operation: str, force_clear: bool = False) -> bool:
+        """Leave a non-normal mode for ``operation``, clearing or raising as configured.
 
+        Hot cursor methods test ``if self._mode:`` inline and only call this
+        when a transition is actually needed.
+        """
         if self.auto_clear_mode_transitions or force_clear:
             if self.warn_on_mode_transitions:
-                logger.warning(f"{operation} requires normal mode. Auto-clearing from {self._current_mode.value} mode.")
+                self._log.warning("%s requires normal mode. Auto-clearing from %s mode.",
+                               operation, self._current_mode.value)
             self.clear_display()
             return True
         else:
             if self.warn_on_mode_transitions:
-                logger.error(f"{operation} requires normal mode. Currently in {self._current_mode.value} mode. "
-                           f"Use clear_display() first or enable auto_clear_mode_transitions.")
+                self._log.error("%s requires normal mode. Currently in %s mode. "
+                             "Use clear_display() first or enable auto_clear_mode_transitions.",
+                             operation, self._current_mode.value)
             raise CD5220DisplayError(f"{operation} requires normal mode. Use clear_display() first.")
 
+    def _cursor_position_command(self, col: int, row: int) -> bytes:
+        """Return the ESC l command for a position."""
+        cmd = self._CURSOR_POSITION_CMDS.get((col, row))
+        if cmd is None:
+            cmd = self.CMD_CURSOR_POSITION + bytes([col, row])
+        return cmd
+
     def _send_cursor_position_raw(self, col: int, row: int, delay: float = None) -> None:
         """Send cursor position command without mode checking."""
-        cmd = self.CMD_CURSOR_POSITION + bytes([col, row])
-        self._send_command(cmd, f"Raw cursor: ({col},{row})", delay)
-
-    def _write_text_raw(self, text: str, delay: float = None) -> None:
+        self._pending_cursor = None
+        self._send_command(self._cursor_position_command(col, row), "Raw cursor: (%d,%d)", delay,
+                           desc_args=(col, row))
+
+    def _write_at_raw(self, col: int, row: int, text: Union[str, bytes], payload: bytes, delay: float = None) -> None:
+        """Position the cursor and write encoded text in one write, without mode checking."""
+        self._pending_cursor = None
+        cmd = self._cursor_position_command(col, row)
+        self._send_commands((cmd, payload) if payload else (cmd,),
+                            "Positioned write (%d,%d): '%s'", delay,
+                            desc_args=(col, row, text))
+
+    def _window_command(self, op: int, start: int, end: int, line: int) -> bytes:
+        """Return the ESC W command for a window, building it once per argument set."""
+        key = (op, start, end, line)
+        cmd = self._WINDOW_CMDS.get(key)
+        if cmd is None:
+            cmd = self.CMD_WINDOW_SET + bytes(key)
+            self._WINDOW_CMDS[key] = cmd
+        return cmd
+
+    def _write_text_raw(self, text: Union[str, bytes], delay: float = None) -> None:
         """Send text without mode checking."""
-        self._send_command(text.encode('ascii', 'ignore'), f"Raw write: '{text}'", delay)
+        self._send_command(_to_display_bytes(text), "Raw write: '%s'", delay, desc_args=(text,))
+
+    def _send_at_cursor(self, command: bytes, description: str, delay: float = None,
+                        desc_args: Tuple[Any, ...] = ()) -> None:
+        """Send a command that acts at the current cursor position.
+
+        If a skipped ``write_positioned`` left the hardware cursor behind, the
+        position it would have reached goes out in the same write, first.
+        """
+        if self._pending_cursor is None:
+            self._send_command(command, description, delay, desc_args=desc_args)
+            return
+        pending, self._pending_cursor = self._pending_cursor, None
+        self._send_commands((self._cursor_position_command(*pending), command),
+                            description, delay, desc_args=desc_args)
+
+    def _remember_positioned(self, col: int, row: int, payload: bytes) -> None:
+        """Record a positioned write, forgetting any earlier writes it overlapped."""
+        end = col + len(payload)
+        for (old_col, old_row), old in list(self._last_frame.items()):
+            if old_row == row and old_col < end and col < old_col + len(old):
+                del self._last_frame[(old_col, old_row)]
+        if end - 1 > self.DISPLAY_WIDTH:
+            # Text wrapped onto the next row
+            self._last_frame.clear()
+        elif payload and end <= self.DISPLAY_WIDTH:
+            # Writes reaching the last column leave the cursor position
+            # hardware-dependent, so they are never skipped
+            self._last_frame[(col, row)] = payload
+
+    def _forget_frame(self) -> None:
+        """Forget the positioned writes on screen and any cursor restore they owe.
+
+        Used by commands that clear the display, move the cursor or change
+        mode, after which neither can be relied on.
+        """
+        self._last_frame.clear()
+        self._pending_cursor = None
+
+    def force_redraw(self) -> None:
+        """Forget previously sent content so the next writes are always transmitted."""
+        self._last_frame.clear()
+        self._last_marquee = None
+        self._string_lines.clear()
 
     # === MODE CONTROL ===
 
     def clear_display(self, delay: float = None) -> None:
         """Clear display and return to normal mode."""
-        self._send_command(self.CMD_CLEAR, "Clear display", delay)
-        self._current_mode = DisplayMode.NORMAL
+        self._forget_frame()
+        self._last_marquee = None
+        self._send_command(self.CMD_CLEAR, "Clear display", delay, drain=True)
+        self._mode = _MODE_NORMAL
         self._active_window = None
         self._sync_simulator_mode()
 
     def cancel_current_line(self, delay: float = None) -> None:
         """Cancel current line and return to normal mode."""
-        self._send_command(self.CMD_CANCEL, "Cancel current line", delay)
-        self._current_mode = DisplayMode.NORMAL
+        self._forget_frame()
+        self._last_marquee = None
+        self._send_command(self.CMD_CANCEL, "Cancel current line", delay, drain=True)
+        self._mode = _MODE_NORMAL
         self._sync_simulator_mode()
 
     def initialize(self, delay: float = None) -> None:
         """Initialize display and return to normal mode."""
         init_delay = delay if delay is not None else self.initialization_delay
+        self._forget_frame()
+        self._last_marquee = None
+        self._cursor_visible = False
+        # Let the reset finish before anything else is sent
         self._send_command(self.CMD_INITIALIZE, "Initialize display", init_delay)
-        self._send_command(self.CMD_CLEAR, "Clear after init", delay)
-        self._current_mode = DisplayMode.NORMAL
+        self._send_command(self.CMD_CLEAR, "Clear display")
+        self._mode = _MODE_NORMAL
         self._active_window = None
         self._sync_simulator_mode()
 
     def restore_defaults(self, delay: float = None) -> None:
-        """Restore factory defaults: brightness 4, overwrite mode, cursor off."""
-        self.clear_display(delay)
-        self.set_brightness(4, delay)
-        self.set_overwrite_mode(delay)
-        self.cursor_off(delay)
+        """Restore factory defaults: brightness 4, overwrite mode, cursor off.
+
+        All four commands go out as one write followed by a single delay
+        (``delay``, or the longer of the base and mode transition delays).
+        """
+        if delay is None:
+            delay = max(self.base_command_delay, self.mode_transition_delay)
+        self._forget_frame()
+        self._last_marquee = None
+        self._send_commands(
+            (self.CMD_CLEAR, self._BRIGHTNESS_CMDS[4], self.CMD_OVERWRITE_MODE, self.CMD_CURSOR_OFF),
+            "Restore defaults",
+            delay,
+        )
+        self._mode = _MODE_NORMAL
+        self._active_window = None
+        self._cursor_visible = False
+        self._sync_simulator_mode()
 
     # === NORMAL MODE METHODS ===
 
@@ -563,12 +1112,14 @@ class CD5220:
     def set_vertical_scroll_mode(self, delay: float = None) -> None:
         """Set vertical scroll mode (normal mode only)."""
         self._ensure_normal_mode("Vertical scroll mode")
+        self._forget_frame()
         mode_delay = delay if delay is not None else self.mode_transition_delay
         self._send_command(self.CMD_VERTICAL_SCROLL, "Set vertical scroll mode", mode_delay)
 
     def set_horizontal_scroll_mode(self, delay: float = None) -> None:
         """Set horizontal scroll mode (normal mode only)."""
         self._ensure_normal_mode("Horizontal scroll mode")
+        self._forget_frame()
         mode_delay = delay if delay is not None else self.mode_transition_delay
         self._send_command(self.CMD_HORIZONTAL_SCROLL, "Set horizontal scroll mode", mode_delay)
 
@@ -584,18 +1135,20 @@ class CD5220:
             raise CD5220DisplayError(f"Invalid brightness level: {level} (must be 1-4)")
 
         self._ensure_normal_mode("Brightness control")
-        cmd = self.CMD_BRIGHTNESS + bytes([level])
-        self._send_command(cmd, f"Set brightness: {level}", delay)
+        self._send_command(self._BRIGHTNESS_CMDS[level], "Set brightness: %d", delay,
+                           desc_args=(level,))
 
     def cursor_on(self, delay: float = None) -> None:
         """Enable cursor (normal mode only)."""
         self._ensure_normal_mode("Cursor control")
-        self._send_command(self.CMD_CURSOR_ON, "Cursor on", delay)
+        self._send_at_cursor(self.CMD_CURSOR_ON, "Cursor on", delay)
+        self._cursor_visible = True
 
     def cursor_off(self, delay: float = None) -> None:
         """Disable cursor (normal mode only)."""
         self._ensure_normal_mode("Cursor control")
         self._send_command(self.CMD_CURSOR_OFF, "Cursor off", delay)
+        self._cursor_visible = False
 
     def set_cursor_position(self, col: int, row: int, delay: float = None) -> None:
         """
@@ -611,45 +1164,76 @@ class CD5220:
         if not 1 <= col <= self.DISPLAY_WIDTH:
             raise CD5220DisplayError(f"Column must be 1-{self.DISPLAY_WIDTH}")
 
-        self._ensure_normal_mode("Cursor positioning")
+        if self._mode:
+            self._transition_to_normal("Cursor positioning")
         self._send_cursor_position_raw(col, row, delay)
 
     def cursor_move_up(self, delay: float = None) -> None:
         """Move cursor up (normal mode only)."""
-        self._ensure_normal_mode("Cursor movement")
-        self._send_command(self.CMD_CURSOR_UP, "Cursor up", delay)
+        if self._mode:
+            self._transition_to_normal("Cursor movement")
+        self._send_at_cursor(self.CMD_CURSOR_UP, "Cursor up", delay)
 
     def cursor_move_down(self, delay: float = None) -> None:
         """Move cursor down (normal mode only)."""
-        self._ensure_normal_mode("Cursor movement")
-        self._send_command(self.CMD_CURSOR_DOWN, "Cursor down", delay)
+        if self._mode:
+            self._transition_to_normal("Cursor movement")
+        self._send_at_cursor(self.CMD_CURSOR_DOWN, "Cursor down", delay)
 
     def cursor_move_left(self, delay: float = None) -> None:
         """Move cursor left (normal mode only)."""
-        self._ensure_normal_mode("Cursor movement")
-        self._send_command(self.CMD_CURSOR_LEFT, "Cursor left", delay)
+        if self._mode:
+            self._transition_to_normal("Cursor movement")
+        self._send_at_cursor(self.CMD_CURSOR_LEFT, "Cursor left", delay)
 
     def cursor_move_right(self, delay: float = None) -> None:
         """Move cursor right (normal mode only)."""
-        self._ensure_normal_mode("Cursor movement")
-        self._send_command(self.CMD_CURSOR_RIGHT, "Cursor right", delay)
+        if self._mode:
+            self._transition_to_normal("Cursor movement")
+        self._send_at_cursor(self.CMD_CURSOR_RIGHT, "Cursor right", delay)
 
     def cursor_home(self, delay: float = None) -> None:
         """Move cursor to home position (1,1) (normal mode only)."""
-        self._ensure_normal_mode("Cursor movement")
+        if self._mode:
+            self._transition_to_normal("Cursor movement")
+        self._pending_cursor = None
         self._send_command(self.CMD_CURSOR_HOME, "Cursor home", delay)
 
-    def write_at_cursor(self, text: str, delay: float = None) -> None:
+    def write_at_cursor(self, text: Union[str, bytes], delay: float = None) -> None:
         """Write text at current cursor position (normal mode only)."""
-        self._ensure_normal_mode("Cursor writing")
-        self._write_text_raw(text, delay)
+        if self._mode:
+            self._transition_to_normal("Cursor writing")
+        self._last_frame.clear()
+        self._send_at_cursor(_to_display_bytes(text), "Raw write: '%s'", delay, desc_args=(text,))
+
+    def write_positioned(self, text: Union[str, bytes], col: int, row: int, delay: float = None) -> None:
+        """
+        Write text at specific position (normal mode only).
+
+        Repeating a write that is already on screen is skipped entirely while
+        nothing else has touched those cells. Call ``force_redraw()`` to make
+        the next writes go out regardless.
+        """
+        payload = _to_display_bytes(text)
+        if (
+            self._mode == _MODE_NORMAL
+            and not self._cursor_visible
+            and self._last_frame.get((col, row)) == payload
+        ):
+            self._pending_cursor = (col + len(payload), row)
+            return
+
+        if row not in (1, 2):
+            raise CD5220DisplayError("Row must be 1 or 2")
+        if not 1 <= col <= self.DISPLAY_WIDTH:
+            raise CD5220DisplayError(f"Column must be 1-{self.DISPLAY_WIDTH}")
 
-    def write_positioned(self, text: str, col: int, row: int, delay: float = None) -> None:
-        """Write text at specific position (normal mode only)."""
-        self.set_cursor_position(col, row, delay)
-        self.write_at_cursor(text, delay)
+        if self._mode:
+            self._transition_to_normal("Cursor writing")
+        self._write_at_raw(col, row, text, payload, delay)
+        self._remember_positioned(col, row, payload)
 
-    def write_positioned_batch(self, text: str, start_col: int, row: int) -> None:
+    def write_positioned_batch(self, text: Union[str, bytes], start_col: int, row: int) -> None:
         """Write multiple contiguous characters starting at position.
 
         Args:
@@ -669,9 +1253,12 @@ class CD5220:
         if not text:
             return
 
-        # Set cursor position ONCE, then write all characters
-        self.set_cursor_position(start_col, row)
-        self.write_at_cursor(text)
+        # Position the cursor and write all characters in one command
+        payload = _to_display_bytes(text)
+        if self._mode:
+            self._transition_to_normal("Cursor writing")
+        self._write_at_raw(start_col, row, text, payload)
+        self._remember_positioned(start_col, row, payload)
 
     def display_on(self, delay: float = None) -> None:
         """Turn display on (normal mode only)."""
@@ -685,7 +1272,25 @@ class CD5220:
 
     # === STRING MODE METHODS ===
 
-    def write_upper_line(self, text: str, delay: float = None) -> None:
+    def _string_mode_command(self, prefix: bytes, text: Union[str, bytes]) -> bytes:
+        """Build an ESC Q A/B command with the text padded to the display width.
+
+        The text is encoded first and padded in bytes, so the command is always
+        exactly prefix + 20 bytes + CR and no padded ``str`` is created.
+        """
+        return _string_command(prefix, text, self.DISPLAY_WIDTH)
+
+    def _shown_string_lines(self) -> Dict[int, bytes]:
+        """Return the string-mode commands on screen, per line.
+
+        The record only holds while the display stays in string mode, so it
+        starts empty whenever string mode is (re)entered.
+        """
+        if self._mode != _MODE_STRING:
+            self._string_lines.clear()
+        return self._string_lines
+
+    def write_upper_line(self, text: Union[str, bytes], delay: float = None, *, force: bool = False) -> None:
         """
         Write to upper line using fast string mode (ESC Q A).
 
@@ -693,34 +1298,45 @@ class CD5220:
         will restore NORMAL mode functionality.
 
         Args:
-            text: Text to display (truncated to 20 chars if longer)
+            text: Text, or pre-encoded ASCII bytes, to display (truncated to 20 chars if longer)
             delay: Optional delay override (for slow hardware)
+            force: Send even if the line already shows this text
         """
         if len(text) > self.DISPLAY_WIDTH:
             text = text[:self.DISPLAY_WIDTH]
-        padded_text = text.ljust(self.DISPLAY_WIDTH)
-        cmd = self.CMD_STRING_UPPER + padded_text.encode('ascii', 'ignore') + b'\x0D'
-        self._send_command(cmd, f"String upper: '{text}'", delay)
-        self._current_mode = DisplayMode.STRING
+        cmd = self._string_mode_command(self.CMD_STRING_UPPER, text)
+        shown = self._shown_string_lines()
+        if not force and shown.get(1) == cmd:
+            return
+        self._forget_frame()
+        self._send_command(cmd, "String upper: '%s'", delay, desc_args=(text,))
+        shown[1] = cmd
+        self._mode = _MODE_STRING
         self._sync_simulator_mode()
 
-    def write_lower_line(self, text: str, delay: float = None) -> None:
+    def write_lower_line(self, text: Union[str, bytes], delay: float = None, *, force: bool = False) -> None:
         """
         Write to lower line using fast string mode (ESC Q B).
 
         Args:
-            text: Text to display (truncated to 20 chars if longer)
+            text: Text, or pre-encoded ASCII bytes, to display (truncated to 20 chars if longer)
             delay: Optional delay override (for slow hardware)
+            force: Send even if the line already shows this text
         """
         if len(text) > self.DISPLAY_WIDTH:
             text = text[:self.DISPLAY_WIDTH]
-        padded_text = text.ljust(self.DISPLAY_WIDTH)
-        cmd = self.CMD_STRING_LOWER + padded_text.encode('ascii', 'ignore') + b'\x0D'
-        self._send_command(cmd, f"String lower: '{text}'", delay)
-        self._current_mode = DisplayMode.STRING
+        cmd = self._string_mode_command(self.CMD_STRING_LOWER, text)
+        shown = self._shown_string_lines()
+        if not force and shown.get(2) == cmd:
+            return
+        self._forget_frame()
+        self._send_command(cmd, "String lower: '%s'", delay, desc_args=(text,))
+        shown[2] = cmd
+        self._mode = _MODE_STRING
         self._sync_simulator_mode()
 
-    def write_both_lines(self, upper: str, lower: str, delay: float = None) -> None:
+    def write_both_lines(self, upper: Union[str, bytes], lower: Union[str, bytes], delay: float = None, *,
+                         force: bool = False) -> None:
         """
         Write to both lines using string mode.
 
@@ -728,32 +1344,75 @@ class CD5220:
             upper: Text for upper line
             lower: Text for lower line
             delay: Optional delay override (for slow hardware)
+            force: Send lines even if they already show this text
+        """
+        self.write_lines({1: upper, 2: lower}, delay, force=force)
+
+    def write_lines(self, lines: Dict[int, Union[str, bytes]], delay: float = None, *,
+                    force: bool = False) -> None:
+        """
+        Write one or both lines in string mode using a single serial write.
+
+        Lines already showing the requested text are left out of the write.
+
+        Args:
+            lines: Mapping of line number (1 or 2) to text, sent upper line first
+            delay: Optional delay override (for slow hardware)
+            force: Send lines even if they already show this text
         """
-        self.write_upper_line(upper, delay)
-        self.write_lower_line(lower, delay)
+        if not lines:
+            return
+        if any(line not in (1, 2) for line in lines):
+            raise CD5220DisplayError("Line must be 1 or 2")
+
+        shown = self._shown_string_lines()
+        changed = {}
+        for line, prefix in ((1, self.CMD_STRING_UPPER), (2, self.CMD_STRING_LOWER)):
+            if line in lines:
+                cmd = self._string_mode_command(prefix, lines[line])
+                if force or shown.get(line) != cmd:
+                    changed[line] = cmd
+        if not changed:
+            return
+
+        self._forget_frame()
+        self._send_commands(tuple(changed.values()), "String lines: %s", delay, desc_args=(lines,))
+        shown.update(changed)
+        self._mode = _MODE_STRING
+        self._sync_simulator_mode()
 
     # === CONTINUOUS SCROLLING METHODS ===
 
-    def scroll_marquee(self, text: str, observe_duration: float = None, delay: float = None) -> None:
+    def scroll_marquee(self, text: Union[str, bytes], observe_duration: float = None, delay: float = None) -> None:
         """
         Start continuous marquee scrolling on upper line (ESC Q D).
 
         Hardware limitation: Upper line only.
 
+        Calling this again with the text that is already scrolling does
+        nothing, so the marquee keeps its position instead of restarting.
+
         Args:
             text: Text to scroll
-            observe_duration: Recommended viewing time
+            observe_duration: Recommended viewing time. Only logged; this call
+                returns once the command is sent and the caller decides how
+                long to leave the marquee running.
             delay: Optional delay override (for slow hardware)
         """
-        cmd = self.CMD_SCROLL_MARQUEE + text.encode('ascii', 'ignore') + b'\x0D'
-        self._send_command(cmd, f"Scroll marquee: '{text}'", delay)
-        self._current_mode = DisplayMode.SCROLL
+        if self._mode == _MODE_SCROLL and text == self._last_marquee:
+            return
+
+        cmd = b''.join((self.CMD_SCROLL_MARQUEE, _to_display_bytes(text), b'\x0D'))
+        self._forget_frame()
+        self._send_command(cmd, "Scroll marquee: '%s'", delay, desc_args=(text,))
+        self._mode = _MODE_SCROLL
+        self._last_marquee = text
         self._sync_simulator_mode()
 
         if observe_duration is None:
             observe_duration = max(8.0, len(text) / self.SCROLL_REFRESH_RATE * 0.5)
 
-        logger.info(f"Marquee scrolling for {observe_duration:.1f}s at ~{self.SCROLL_REFRESH_RATE}Hz")
+        self._log.info("Marquee scrolling for %.1fs at ~%sHz", observe_duration, self.SCROLL_REFRESH_RATE)
 
     # === WINDOW MANAGEMENT METHODS ===
 
@@ -780,11 +1439,12 @@ class CD5220:
         hw_start_col = start_col - 1
         hw_end_col = end_col - 1
 
-        cmd = self.CMD_WINDOW_SET + bytes([1, hw_start_col, hw_end_col, line])
+        cmd = self._window_command(1, hw_start_col, hw_end_col, line)
         self._send_command(
             cmd,
-            f"Set window: line {line}, cols {start_col}-{end_col}",
+            "Set window: line %d, cols %d-%d",
             delay,
+            desc_args=(line, start_col, end_col),
         )
         self._active_window = (line, start_col, end_col)
         self._sync_simulator_mode()
@@ -796,8 +1456,21 @@ class CD5220:
 
         self._ensure_normal_mode("Window management")
 
-        cmd = self.CMD_WINDOW_SET + bytes([0, 0, 0, line])
-        self._send_command(cmd, f"Clear window: line {line}", delay)
+        cmd = self._window_command(0, 0, 0, line)
+        self._send_command(cmd, "Clear window: line %d", delay, desc_args=(line,))
+
+        self._active_window = None
+        self._sync_simulator_mode()
+
+    def clear_all_windows(self, delay: float = None) -> None:
+        """Clear windows on both lines with a single write (normal mode only)."""
+        self._ensure_normal_mode("Window management")
+
+        self._send_commands(
+            (self._window_command(0, 0, 0, 1), self._window_command(0, 0, 0, 2)),
+            "Clear all windows",
+            delay,
+        )
 
         self._active_window = None
         self._sync_simulator_mode()
@@ -816,19 +1489,21 @@ class CD5220:
             raise CD5220DisplayError("No windows configured. Use set_window() first.")
 
         self._ensure_normal_mode("Viewport mode entry")
-        self.set_horizontal_scroll_mode(delay)
-        self._current_mode = DisplayMode.VIEWPORT
+        self._forget_frame()
+        mode_delay = delay if delay is not None else self.mode_transition_delay
+        self._send_command(self.CMD_HORIZONTAL_SCROLL, "Set horizontal scroll mode", mode_delay)
+        self._mode = _MODE_VIEWPORT
         self._sync_simulator_mode()
 
-        logger.info(
-            f"Entered viewport mode with window: line {self._active_window[0]},"
-            f" cols {self._active_window[1]}-{self._active_window[2]}"
+        self._log.info(
+            "Entered viewport mode with window: line %d, cols %d-%d",
+            *self._active_window,
         )
 
     def write_viewport(
         self,
         line: int,
-        text: str,
+        text: Union[str, bytes],
         char_delay: float = None,
         delay: float = None,
     ) -> None:
@@ -837,31 +1512,49 @@ class CD5220:
 
         Args:
             line: Line number (1 or 2)
-            text: Text to write
+            text: Text, or pre-encoded ASCII bytes, to write
             char_delay: If None, writes all text at once (fast).
                        If specified, writes character-by-character with delay (smooth building effect).
+                       With ``background_writer`` the characters are queued with
+                       their pacing and the call returns at once; use ``wait_idle()``
+                       to wait for the effect to finish.
             delay: Optional delay override for positioning commands (for slow hardware)
         """
-        if self._current_mode != DisplayMode.VIEWPORT:
+        if self._mode != _MODE_VIEWPORT:
             raise CD5220DisplayError("Must be in viewport mode. Use enter_viewport_mode() first.")
 
         if not self._active_window or self._active_window[0] != line:
             raise CD5220DisplayError(f"No window configured for line {line}")
 
         start_col, end_col = self._active_window[1], self._active_window[2]
+        self._forget_frame()
 
         if char_delay is None:
             # Fast mode: write entire text at once (original behavior)
             self._send_cursor_position_raw(start_col, line, delay)
             self._write_text_raw(text, delay)
-            logger.debug(f"Viewport write: line {line}, window {start_col}-{end_col}, text: '{text}'")
+            if self._debug_enabled:
+                self._log.debug("Viewport write: line %d, window %d-%d, text: '%s'",
+                             line, start_col, end_col, text)
         else:
             # Smooth mode: character-by-character building with hardware cursor management
             self._send_cursor_position_raw(start_col, line, delay)
-            logger.debug(f"Viewport incremental write: line {line}, window {start_col}-{end_col}, text: '{text}'")
-
-            for char in text:
-                self._write_text_raw(char, delay)
+            if self._debug_enabled:
+                self._log.debug("Viewport incremental write: line %d, window %d-%d, text: '%s'",
+                             line, start_col, end_col, text)
+
+            if self._writer_queue is not None and self._batch_buf is None:
+                # The writer thread paces each character off the caller's thread
+                if delay is None:
+                    delay = self.base_command_delay
+                char_delay = max(char_delay, delay)
+                # Slices keep bytes input as bytes; iterating it would yield ints
+                for i in range(len(text)):
+                    self._write_text_raw(text[i:i + 1], char_delay)
+                return
+
+            for i in range(len(text)):
+                self._write_text_raw(text[i:i + 1], delay)
                 time.sleep(char_delay)
 
     # === FONT CONTROL ===
@@ -869,14 +1562,18 @@ class CD5220:
     def set_international_font(self, font_id: int, delay: float = None) -> None:
         """Set international font (normal mode only)."""
         self._ensure_normal_mode("Font selection")
+        self._last_frame.clear()
         cmd = self.CMD_INTERNATIONAL_FONT + bytes([font_id])
-        self._send_command(cmd, f"Set international font: {font_id}", delay)
+        self._send_command(cmd, "Set international font: %d", delay,
+                           desc_args=(font_id,))
 
     def set_extended_font(self, font_id: int, delay: float = None) -> None:
         """Set extended font (normal mode only)."""
         self._ensure_normal_mode("Font selection")
+        self._last_frame.clear()
         cmd = self.CMD_EXTENDED_FONT + bytes([font_id])
-        self._send_command(cmd, f"Set extended font: {font_id}", delay)
+        self._send_command(cmd, "Set extended font: %d", delay,
+                           desc_args=(font_id,))
 
     # === CONVENIENCE METHODS ===
 
@@ -890,30 +1587,54 @@ class CD5220:
             mode: Display mode ("string" or "normal")
             delay: Optional delay override (for slow hardware)
         """
-        lines = [message[i:i+self.DISPLAY_WIDTH] for i in range(0, len(message), self.DISPLAY_WIDTH)]
+        # Only two lines fit, so slice them directly instead of chunking the whole message
+        upper = message[:self.DISPLAY_WIDTH]
+        lower = message[self.DISPLAY_WIDTH:2 * self.DISPLAY_WIDTH]
 
         if mode == "string":
-            if len(lines) >= 1:
-                self.write_upper_line(lines[0], delay)
-            if len(lines) >= 2:
-                self.write_lower_line(lines[1], delay)
+            lines = {}
+            if upper:
+                lines[1] = upper
+            if lower:
+                lines[2] = lower
+            self.write_lines(lines, delay)
         else:  # normal mode
-            self.clear_display(delay)
-            if len(lines) >= 1:
-                self.write_positioned(lines[0], 1, 1, delay)
-            if len(lines) >= 2:
-                self.write_positioned(lines[1], 1, 2, delay)
+            with self.batch():
+                # Two full-width lines overwrite every cell, so the clear is
+                # only needed to leave another mode, drop a window set by
+                # set_window(), or blank leftover cells
+                if (self._mode or self._active_window is not None
+                        or len(lower) < self.DISPLAY_WIDTH):
+                    self.clear_display(delay)
+                if upper:
+                    self.write_positioned(upper, 1, 1, delay)
+                if lower:
+                    self.write_positioned(lower, 1, 2, delay)
 
         time.sleep(duration)
 
     def close(self) -> None:  # pragma: no cover - hardware cleanup
         """Close serial connection."""
-        if getattr(self, 'ser', None) is not None and self.ser.is_open:
+        if self._writer_thread is not None:
+            # Let the writer finish everything already queued
+            self._writer_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._writer_queue = None
+        if self.ser is not None and self.ser.is_open:
             try:
-                logger.debug("Closing serial connection")
+                self._log.debug("Closing serial connection")
+                if self.hardware_enabled:
+                    self.ser.flush()
                 self.ser.close()
             except Exception as e:
-                logger.error(f"Error closing connection: {e}")
+                self._log.error("Error closing connection: %s", e)
+        if self._debug_held:
+            _disable_debug_logging(self.debug_ring)
+            self._debug_held = False
+        if self.debug_ring is not None:
+            self.debug_ring.dump()
+            self.debug_ring = None
 
     def __enter__(self):  # pragma: no cover - context helper
         return self
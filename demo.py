@@ -10,8 +10,16 @@ Demonstrates all documented modes and features with proper test isolation:
 - Smart Mode Management: Automatic transitions and error handling
 """
 
+import atexit
+import io
+import json
 import time
 import logging
+import queue
+import selectors
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, List, Tuple
 from cd5220 import serial
 import argparse
 from cd5220 import (
@@ -27,10 +35,30 @@ logging.basicConfig(
     datefmt='%H:%M:%S'
 )
 logger = logging.getLogger('CD5220_Demo')
+FAST_LOG_FORMAT = '%(relativeCreated)6d %(levelname)-8s [DEMO] %(message)s'
+
+# Loop contents for the stepped demos, built once at import
+# (level, lower line, observation note) for the brightness walk
+BRIGHTNESS_STEPS = tuple(
+    (level,
+     f"LEVEL: {level}/4" + {1: " (MIN)", 4: " (MAX)"}.get(level, ""),
+     f"Brightness level {level}")
+    for level in range(1, 5)
+)
+# (col, row, label) for the cursor walk
+CURSOR_STEPS = tuple(
+    (col, 2, str(i))
+    for i, col in enumerate((1, 5, 10, 15, 20), start=1)
+)
+# (upper, lower) frames for the rapid-update demo
+RAPID_UPDATES = tuple((f"UPDATE: {i}", f"COUNTER: {i}") for i in range(1, 6))
 
 class CD5220DemoFixture:
     """Demo fixture providing proper isolation and timing control."""
     
+    # Lateness treated as timer jitter and reclaimed by the next pause
+    DRIFT_SLACK = 0.05
+
     def __init__(self, display: CD5220, delay_multiplier: float = 1.0):
         self.display = display
         self.delay_multiplier = delay_multiplier
@@ -42,50 +70,95 @@ class CD5220DemoFixture:
         self.SCROLL_OBSERVATION_TIME = 8.0 * delay_multiplier
         self.VIEWPORT_DEMO_TIME = 6.0 * delay_multiplier
         self.STEP_PAUSE = 1.0 * delay_multiplier
+        self.CURSOR_STEP_PAUSE = 0.5 * delay_multiplier
+        self.UPDATE_STEP_PAUSE = 0.4 * delay_multiplier
+        self._deadline = time.monotonic()
+        # False only between a teardown and the next setup, when the display
+        # is known to be at its defaults
+        self._dirty = True
         
-    def setup_demo(self, title: str, subtitle: str = "STARTING...") -> None:
-        """Reset to known state and show demo title."""
-        self.display.restore_defaults()
-        title_truncated = title[:16] if len(title) > 16 else title
-        self.display.write_both_lines(f"DEMO: {title_truncated}", subtitle)
-        time.sleep(self.VISUAL_CONFIRMATION_TIME)
+    def setup_demo(self, title: str, subtitle: str = "STARTING...",
+                   heading: str = None) -> None:
+        """Reset to known state and show demo title.
+
+        ``heading`` is the prebuilt upper line; it defaults to
+        ``demo_heading(title)``.
+        """
+        if self._dirty:
+            self.display.restore_defaults()
+        self._dirty = True
+        if heading is None:
+            heading = demo_heading(title)
+        self.display.write_both_lines(heading, subtitle)
+        self.wait(self.VISUAL_CONFIRMATION_TIME)
         
     def teardown_demo(self) -> None:
-        """Clean teardown after each demo."""
+        """Clean teardown after each demo.
+
+        The next ``setup_demo`` on this fixture skips its own reset.
+        """
         self.display.restore_defaults()
-        time.sleep(self.MODE_TRANSITION_DELAY)
+        self._dirty = False
+        self.wait(self.MODE_TRANSITION_DELAY)
+
+    def wait(self, duration: float) -> None:
+        """Pause for the operator, then wait for any queued commands to finish.
+
+        Pauses run on a monotonic schedule: oversleep of up to DRIFT_SLACK is
+        taken out of the next pause so timer jitter does not accumulate. With a
+        background writer the display drains while we sleep, so the pause
+        overlaps serial I/O instead of following it.
+        """
+        now = time.monotonic()
+        if now - self._deadline > self.DRIFT_SLACK:
+            # Behind by more than jitter (slow output, a long effect): restart
+            # the schedule rather than cutting the pause short
+            self._deadline = now
+        self._deadline += duration
+        remaining = self._deadline - now
+        if remaining > 0:
+            time.sleep(remaining)
+        self.display.wait_idle()
         
     def show_banner(self, upper: str, lower: str = "", duration: float = None) -> None:
         """Show a banner message."""
         if duration is None:
             duration = self.VISUAL_CONFIRMATION_TIME
         self.display.write_both_lines(upper, lower)
-        time.sleep(duration)
+        self.wait(duration)
         
     def pause_for_observation(self, description: str, duration: float = None) -> None:
         """Pause with logging for operator observation."""
         if duration is None:
             duration = self.VISUAL_CONFIRMATION_TIME
-        logger.info(f"Observe: {description} (pausing {duration:.1f}s)")
-        time.sleep(duration)
+        logger.info("Observe: %s (pausing %.1fs)", description, duration)
+        self.wait(duration)
+
+def demo_heading(title: str) -> str:
+    """Return the upper-line heading shown when a demo starts."""
+    return f"DEMO: {title[:16]}"
 
 def isolated_demo(title: str):
     """
     Decorator that wraps an individual demo function with:
-    • CD5220DemoFixture creation
+    • CD5220DemoFixture creation (or reuse of one passed as ``fixture``)
     • automatic setup / teardown
     • uniform logging
     """
+    heading = demo_heading(title)  # built once, reused on every run
+
     def decorator(fn):
-        def wrapped(display: CD5220, delay_multiplier: float):
-            fixture = CD5220DemoFixture(display, delay_multiplier)
-            logger.info(f"Starting demo: {title}")
-            fixture.setup_demo(title)
+        def wrapped(display: CD5220, delay_multiplier: float,
+                    fixture: CD5220DemoFixture = None):
+            if fixture is None:
+                fixture = CD5220DemoFixture(display, delay_multiplier)
+            logger.info("Starting demo: %s", title)
+            fixture.setup_demo(title, heading=heading)
             try:
                 fn(display, fixture)          # run user demo
             finally:
                 fixture.teardown_demo()
-            logger.info(f"Completed demo: {title}")
+            logger.info("Completed demo: %s", title)
         return wrapped
     return decorator
 
@@ -96,38 +169,38 @@ def demo_normal_mode_features(display: CD5220, fixture: CD5220DemoFixture):
     # Test brightness control with content visible
     fixture.show_banner("BRIGHTNESS DEMO", "OBSERVE CHANGES")
     
-    # Start with brightness level 1 for maximum contrast demonstration
-    display.set_brightness(1)
-    display.write_both_lines("BRIGHTNESS TEST", "LEVEL: 1/4 (MIN)")
-    fixture.pause_for_observation("Brightness level 1", fixture.BRIGHTNESS_PAUSE)
-    
-    # Progress through brightness levels
-    for level in range(2, 5):
-        display.set_brightness(level)
-        level_text = f"LEVEL: {level}/4" + (" (MAX)" if level == 4 else "")
-        display.write_both_lines("BRIGHTNESS TEST", level_text)
-        fixture.pause_for_observation(f"Brightness level {level}", fixture.BRIGHTNESS_PAUSE)
+    # Start with brightness level 1 for maximum contrast demonstration,
+    # then progress through the remaining levels
+    for level, level_text, description in BRIGHTNESS_STEPS:
+        # Brightness change and its label go out as one write
+        with display.batch():
+            display.set_brightness(level)
+            display.write_both_lines("BRIGHTNESS TEST", level_text)
+        fixture.pause_for_observation(description, fixture.BRIGHTNESS_PAUSE)
     
     # Test cursor functionality  
     fixture.show_banner("CURSOR DEMO", "POSITIONING")
     display.clear_display()
-    display.write_positioned("CURSOR DEMO", 1, 1)
-    display.cursor_on()
-    
-    # Move cursor through positions with visible feedback
-    positions = [(1, 2), (5, 2), (10, 2), (15, 2), (20, 2)]
-    for i, (col, row) in enumerate(positions):
-        display.set_cursor_position(col, row)
-        display.write_at_cursor(str(i+1))
-        time.sleep(0.5 * fixture.delay_multiplier)
+    with display.batch():
+        display.write_positioned("CURSOR DEMO", 1, 1)
+        display.cursor_on()
+    
+    # Move cursor through positions with visible feedback; each move and
+    # its label share one write, the pause between steps is the effect
+    for col, row, label in CURSOR_STEPS:
+        with display.batch():
+            display.set_cursor_position(col, row)
+            display.write_at_cursor(label)
+        fixture.wait(fixture.CURSOR_STEP_PAUSE)
     
     display.cursor_off()
     fixture.pause_for_observation("Cursor positioning complete", fixture.VISUAL_CONFIRMATION_TIME)
     
     # Test positioned writing
     display.clear_display()
-    display.write_positioned("NORMAL MODE", 1, 1)
-    display.write_positioned("POSITIONED TEXT", 1, 2)
+    with display.batch():
+        display.write_positioned("NORMAL MODE", 1, 1)
+        display.write_positioned("POSITIONED TEXT", 1, 2)
     fixture.pause_for_observation("Normal mode writing", fixture.VISUAL_CONFIRMATION_TIME)
 
 @isolated_demo("STRING MODE")
@@ -136,9 +209,10 @@ def demo_string_mode_features(display: CD5220, fixture: CD5220DemoFixture):
     
     # Test basic string writing
     fixture.show_banner("STRING MODE", "FAST WRITING")
-    display.write_upper_line("STRING MODE DEMO")
-    display.write_lower_line("FAST LINE WRITING")
-    logger.info(f"Current mode: {display.current_mode.value}")
+    with display.batch():
+        display.write_upper_line("STRING MODE DEMO")
+        display.write_lower_line("FAST LINE WRITING")
+    logger.info("Current mode: %s", display.current_mode.value)
     fixture.pause_for_observation("String mode writing", fixture.VISUAL_CONFIRMATION_TIME)
     
     # Test both lines together
@@ -147,8 +221,9 @@ def demo_string_mode_features(display: CD5220, fixture: CD5220DemoFixture):
     
     # Test text handling (intentional truncation demo)
     fixture.show_banner("TEXT HANDLING", "TRUNCATION TEST")
-    display.write_upper_line("THIS IS A VERY LONG LINE THAT EXCEEDS TWENTY CHARACTERS")
-    display.write_lower_line("TRUNCATED TO 20")
+    with display.batch():
+        display.write_upper_line("THIS IS A VERY LONG LINE THAT EXCEEDS TWENTY CHARACTERS")
+        display.write_lower_line("TRUNCATED TO 20")
     fixture.pause_for_observation("Long text truncation", fixture.VISUAL_CONFIRMATION_TIME)
     
     # Test automatic padding
@@ -166,10 +241,10 @@ def demo_continuous_scrolling(display: CD5220, fixture: CD5220DemoFixture):
     
     scroll_text = "CONTINUOUS MARQUEE SCROLLING AT 1HZ - AUTOMATIC MOVEMENT UNTIL STOPPED"
     display.scroll_marquee(scroll_text)
-    logger.info(f"Current mode: {display.current_mode.value}")
+    logger.info("Current mode: %s", display.current_mode.value)
     
     # Allow sufficient observation time
-    time.sleep(fixture.SCROLL_OBSERVATION_TIME)
+    fixture.wait(fixture.SCROLL_OBSERVATION_TIME)
     
     # Clean exit from scroll mode
     display.cancel_current_line()
@@ -184,18 +259,23 @@ def demo_viewport_mode(display: CD5220, fixture: CD5220DemoFixture):
     fixture.show_banner("VIEWPORT MODE", "WINDOW CONSTRAINED")
     display.clear_display()
     
-    # Set up static context FIRST with consistent 1-based indexing
-    display.write_positioned("****", 1, 1)      # Positions 1-4
-    display.write_positioned("****", 17, 1)     # Positions 17-20
-    display.write_positioned("WINDOW: COLS 5-16", 1, 2)  # Updated label
-    
-    # NOW set window with 1-based indexing and enter viewport mode
-    display.set_window(1, 5, 16)  # Window columns 5-16 (12 characters)
-    display.enter_viewport_mode()
+    # Static context, window and mode change go out as a single write
+    with display.batch():
+        # Set up static context FIRST with consistent 1-based indexing
+        display.write_positioned("****", 1, 1)      # Positions 1-4
+        display.write_positioned("****", 17, 1)     # Positions 17-20
+        display.write_positioned("WINDOW: COLS 5-16", 1, 2)  # Updated label
+        
+        # NOW set window with 1-based indexing and enter viewport mode
+        display.set_window(1, 5, 16)  # Window columns 5-16 (12 characters)
+        display.enter_viewport_mode()
     
     # Demonstrate smooth incremental character building
     test_text = "INCREMENTAL_DEMO_TEXT"
     display.write_viewport(1, test_text, char_delay=0.3 * fixture.delay_multiplier)
+    # With a background writer the text is still being built when the call
+    # returns; start the observation pause once it is all on screen
+    display.wait_idle()
     
     fixture.pause_for_observation("Smooth incremental building", fixture.VIEWPORT_DEMO_TIME)
     
@@ -203,14 +283,15 @@ def demo_viewport_mode(display: CD5220, fixture: CD5220DemoFixture):
     fixture.show_banner("FAST VIEWPORT", "INSTANT WRITING")
     display.clear_display()
     
-    # Static markers
-    display.write_positioned("ID:[", 1, 1)
-    display.write_positioned("]", 16, 1)
-    display.write_positioned("FAST MODE", 1, 2)
-    
-    # Different window for variety
-    display.set_window(1, 5, 15)
-    display.enter_viewport_mode()
+    with display.batch():
+        # Static markers
+        display.write_positioned("ID:[", 1, 1)
+        display.write_positioned("]", 16, 1)
+        display.write_positioned("FAST MODE", 1, 2)
+        
+        # Different window for variety
+        display.set_window(1, 5, 15)
+        display.enter_viewport_mode()
     
     # Fast writing (no char_delay)
     display.write_viewport(1, "INSTANT_OVERFLOW_TEXT")
@@ -229,20 +310,21 @@ def demo_smart_mode_management(display: CD5220, fixture: CD5220DemoFixture):
     
     # Trigger auto-clear with normal mode operation
     logger.info("Triggering auto-clear...")
-    display.set_brightness(3)  # This requires normal mode
-    display.write_positioned("AUTO-CLEAR WORKED", 1, 1)
-    display.write_positioned("NOW NORMAL MODE", 1, 2)
+    with display.batch():
+        display.set_brightness(3)  # This requires normal mode
+        display.write_positioned("AUTO-CLEAR WORKED", 1, 1)
+        display.write_positioned("NOW NORMAL MODE", 1, 2)
     fixture.pause_for_observation("Auto-clear completed", fixture.VISUAL_CONFIRMATION_TIME)
     
     # Test manual mode control
     fixture.show_banner("MANUAL CONTROL", "EXPLICIT CLEARING")
-    display.write_upper_line("MANUAL DEMO")
-    display.write_lower_line("WILL CLEAR MANUALLY")
+    display.write_both_lines("MANUAL DEMO", "WILL CLEAR MANUALLY")
     fixture.pause_for_observation("Before manual clear", fixture.STEP_PAUSE)
     
     display.clear_display()
-    display.write_positioned("MANUAL CLEAR OK", 1, 1)
-    display.write_positioned("USER CONTROLLED", 1, 2)
+    with display.batch():
+        display.write_positioned("MANUAL CLEAR OK", 1, 1)
+        display.write_positioned("USER CONTROLLED", 1, 2)
     fixture.pause_for_observation("Manual clear completed", fixture.VISUAL_CONFIRMATION_TIME)
 
 @isolated_demo("CONFIG OPT")
@@ -268,14 +350,15 @@ def demo_configuration_options(display: CD5220, fixture: CD5220DemoFixture):
             display.cursor_on()
             logger.error("ERROR: Protection failed!")
         except CD5220DisplayError as e:
-            logger.info(f"Expected error: {e}")
+            logger.info("Expected error: %s", e)
             fixture.show_banner("ERROR CAUGHT", "PROTECTION WORKS")
             fixture.pause_for_observation("Error protection working", fixture.VISUAL_CONFIRMATION_TIME)
         
         # Manual clear should work
         display.clear_display()
-        display.write_positioned("MANUAL CLEAR OK", 1, 1)
-        display.write_positioned("PROTECTION WORKS", 1, 2)
+        with display.batch():
+            display.write_positioned("MANUAL CLEAR OK", 1, 1)
+            display.write_positioned("PROTECTION WORKS", 1, 2)
         fixture.pause_for_observation("Manual override", fixture.VISUAL_CONFIRMATION_TIME)
         
     finally:
@@ -295,19 +378,21 @@ def demo_convenience_features(display: CD5220, fixture: CD5220DemoFixture):
     # Test viewport convenience with smooth building
     fixture.show_banner("SMOOTH VIEWPORT", "CONVENIENCE DEMO")
     display.clear_display()
-    display.write_positioned("DEMO: COLS 6-16", 1, 2)
-    
-    # Manual viewport setup for demonstration
-    display.set_window(1, 6, 16)
-    display.enter_viewport_mode()
+    with display.batch():
+        display.write_positioned("DEMO: COLS 6-16", 1, 2)
+        
+        # Manual viewport setup for demonstration
+        display.set_window(1, 6, 16)
+        display.enter_viewport_mode()
     display.write_viewport(1, "CONVENIENCE_DEMO_TEXT", char_delay=0.25 * fixture.delay_multiplier)
+    display.wait_idle()
     fixture.pause_for_observation("Smooth convenience demo", fixture.VISUAL_CONFIRMATION_TIME)
     
     # Test rapid updates
     fixture.show_banner("RAPID UPDATES", "STRING MODE")
-    for i in range(5):
-        display.write_both_lines(f"UPDATE: {i+1}", f"COUNTER: {i+1}")
-        time.sleep(0.4 * fixture.delay_multiplier)
+    for upper, lower in RAPID_UPDATES:
+        display.write_both_lines(upper, lower)
+        fixture.wait(fixture.UPDATE_STEP_PAUSE)
     
     fixture.pause_for_observation("Rapid updates complete", fixture.STEP_PAUSE)
 
@@ -326,6 +411,93 @@ def demo_ascii_animations(display: CD5220, fixture: CD5220DemoFixture):
     animations.play_demo_cycle()
     fixture.pause_for_observation("Cycle complete", fixture.STEP_PAUSE)
 
+class RecordingPort:
+    """
+    Serial stand-in for ``--record``: keeps every write with its offset in
+    seconds from the start, so a run can be replayed on hardware without
+    the demo code, logging or simulator in the loop.
+    """
+
+    def __init__(self):
+        self.writes: List[Tuple[float, bytes]] = []
+        self.is_open = True
+        self.out_waiting = 0
+        self._start = time.monotonic()
+
+    def write(self, data: bytes) -> int:
+        self.writes.append((time.monotonic() - self._start, bytes(data)))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def save(self, path: str) -> None:
+        """Write the recording as JSON ``[[offset, hex bytes], ...]``."""
+        with open(path, 'w') as f:
+            json.dump([[offset, data.hex()] for offset, data in self.writes], f)
+
+def replay_recording(ser: serial.Serial, path: str) -> None:
+    """Send a ``--record`` capture to ``ser`` at its original offsets."""
+    with open(path) as f:
+        steps = [(offset, bytes.fromhex(data)) for offset, data in json.load(f)]
+    write = ser.write
+    start = time.monotonic()
+    for offset, data in steps:
+        remaining = start + offset - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        write(data)
+    ser.flush()
+    logger.info("Replayed %d writes in %.2fs", len(steps), time.monotonic() - start)
+
+def wait_for_enter(prompt: str, keepalive: Callable[[], None] = None,
+                   interval: float = 3.0) -> None:
+    """
+    Wait for the operator to press Enter, calling ``keepalive`` every
+    ``interval`` seconds meanwhile. Falls back to a plain ``input()`` where
+    stdin cannot be polled (Windows consoles, redirected streams).
+    """
+    try:
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        input(prompt)
+        return
+    print(prompt, end="", flush=True)
+    try:
+        while not selector.select(interval):
+            if keepalive is not None:
+                keepalive()
+    finally:
+        selector.close()
+    sys.stdin.readline()
+
+# Demo suites with balanced coverage
+DEMO_SUITES = {
+    'core': (
+        demo_normal_mode_features,
+        demo_string_mode_features,
+        demo_smart_mode_management,
+    ),
+    'scrolling': (
+        demo_continuous_scrolling,
+        demo_viewport_mode,
+    ),
+    'config': (
+        demo_configuration_options,
+    ),
+    'convenience': (
+        demo_convenience_features,
+    ),
+    'ascii': (
+        demo_ascii_animations,
+    ),
+}
+ALL_DEMOS = tuple(demo for suite in DEMO_SUITES.values() for demo in suite)
+
 def run_comprehensive_demo(display: CD5220, config):
     """Run comprehensive demo with balanced feature coverage."""
     logger.info("=== CD5220 COMPREHENSIVE DEMO ===")
@@ -334,61 +506,58 @@ def run_comprehensive_demo(display: CD5220, config):
     display.display_message("CD5220 COMPREHENSIVE DEMO - STARTING", 
                           duration=3 * config.delay_multiplier)
     
-    # Demo suites with balanced coverage
-    demo_suites = {
-        'core': [
-            demo_normal_mode_features,
-            demo_string_mode_features,
-            demo_smart_mode_management
-        ],
-        'scrolling': [
-            demo_continuous_scrolling,
-            demo_viewport_mode
-        ],
-        'config': [
-            demo_configuration_options
-        ],
-        'convenience': [
-            demo_convenience_features
-        ],
-        'ascii': [
-            demo_ascii_animations
-        ]
-    }
-    
     if config.demo == 'all':
-        selected_demos = []
-        for suite in demo_suites.values():
-            selected_demos.extend(suite)
+        selected_demos = ALL_DEMOS
     else:
-        selected_demos = demo_suites.get(config.demo, demo_suites['core'])
+        selected_demos = DEMO_SUITES.get(config.demo, DEMO_SUITES['core'])
     
-    # Run selected demos
+    # Run selected demos, sharing one fixture for the whole run
+    fixture = CD5220DemoFixture(display, config.delay_multiplier)
     for demo_func in selected_demos:
-        demo_func(display, config.delay_multiplier)
+        demo_func(display, config.delay_multiplier, fixture=fixture)
         
         if not config.auto_advance:
-            input("Press Enter to continue...")
+            # Surface background-writer errors while the operator reads
+            wait_for_enter("Press Enter to continue...", keepalive=display.wait_idle)
         else:
             time.sleep(1.0 * config.delay_multiplier)
     
-    # Completion message
-    display.restore_defaults()
-    display.write_both_lines("ALL DEMOS", "COMPLETED!")
+    # Completion message, reset and text in one write
+    with display.batch():
+        display.restore_defaults()
+        display.write_both_lines("ALL DEMOS", "COMPLETED!")
     time.sleep(2 * config.delay_multiplier)
     
     logger.info("=== COMPREHENSIVE DEMO COMPLETED ===")
 
+def log_in_background() -> QueueListener:
+    """
+    Move the root log handlers behind a queue so writing log lines happens on
+    a listener thread instead of between display commands. The listener is
+    stopped at exit, flushing anything still queued.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 def main():
     """Main demo execution with CLI configuration."""
     parser = argparse.ArgumentParser(description="CD5220 VFD Display Demo")
     parser.add_argument('--port', default=None,
                         help='Serial port device (omit for simulator only)')
     parser.add_argument('--baud', type=int, default=9600, 
-                       help='Baud rate (default: 9600)')
+                       help='Baud rate; must match the display setting. Faster rates '
+                            'shorten every write (default: 9600)')
     parser.add_argument('--fast', action='store_true', 
                        help='Reduce delays for experienced users')
-    parser.add_argument('--demo', choices=['all', 'core', 'scrolling', 'config', 'convenience', 'ascii'],
+    parser.add_argument('--demo', choices=['all', *DEMO_SUITES],
                        default='all', help='Run specific demo suite')
     parser.add_argument('--auto-advance', action='store_true',
                        help='Auto-advance between demos')
@@ -404,26 +573,70 @@ def main():
                        help='Show console frames even for non-visual commands')
     parser.add_argument('--hardware-only', action='store_true',
                        help='Disable simulator when a port is provided')
+    parser.add_argument('--hw-drain', action='store_true',
+                       help='Wait for the UART to drain after each write instead of relying on fixed delays')
+    parser.add_argument('--low-latency', action='store_true',
+                       help='On Linux, set low-latency mode on USB serial adapters so small writes are sent at once')
+    parser.add_argument('--background-writer', action='store_true',
+                       help='Write to the port from a background thread so pauses overlap serial I/O')
+    
+    parser.add_argument('--record', metavar='PATH',
+                       help='Capture the demo byte stream to PATH (JSON) instead of driving a port')
+    parser.add_argument('--replay', metavar='PATH',
+                       help='Send a --record capture to --port at its original timing and exit')
     
     args = parser.parse_args()
     
     # Configure timing
     args.delay_multiplier = 0.3 if args.fast else 1.0
     
-    # Configure logging
+    # Configure logging. No format here uses thread or process fields
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if args.fast:
+        # Milliseconds since start instead of a per-record strftime
+        fast_formatter = logging.Formatter(FAST_LOG_FORMAT)
+        for handler in logging.getLogger().handlers:
+            handler.setFormatter(fast_formatter)
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
+        # Library debug records propagate to the queued root handlers below,
+        # rather than using the library's own synchronous stderr handler
+        logging.getLogger('CD5220').setLevel(logging.DEBUG)
+    log_in_background()
     
     logger.info("CD5220 Demo Suite")
-    logger.info(f"Port: {args.port} | Baud: {args.baud} | Demo: {args.demo}")
-    logger.info(f"Fast mode: {args.fast} | Auto-advance: {args.auto_advance}")
-    logger.info(f"Base command delay: {args.base_command_delay}s | Mode transition delay: {args.mode_transition_delay}s")
+    logger.info("Port: %s | Baud: %s | Demo: %s", args.port, args.baud, args.demo)
+    logger.info("Fast mode: %s | Auto-advance: %s", args.fast, args.auto_advance)
+    logger.info("Base command delay: %ss | Mode transition delay: %ss",
+                args.base_command_delay, args.mode_transition_delay)
     
     try:
         if args.hardware_only and not args.port:
             parser.error('--hardware-only requires --port')
+        if args.replay and not args.port:
+            parser.error('--replay requires --port')
+        if args.record and args.port:
+            parser.error('--record captures without hardware; omit --port')
+
+        if args.replay:
+            with serial.Serial(port=args.port, baudrate=args.baud, write_timeout=1) as ser:
+                replay_recording(ser, args.replay)
+            return
 
-        if args.port:
+        recorder = None
+        if args.record:
+            recorder = RecordingPort()
+            display = CD5220(
+                recorder,
+                debug=False,
+                base_command_delay=args.base_command_delay,
+                mode_transition_delay=args.mode_transition_delay,
+                render_console=args.console,
+                console_verbose=args.console_verbose,
+            )
+        elif args.port:
             if args.hardware_only:
                 factory = CD5220.create_hardware_only
             else:
@@ -431,15 +644,18 @@ def main():
             display = factory(
                 args.port,
                 baudrate=args.baud,
-                debug=args.verbose,
+                debug=False,
                 base_command_delay=args.base_command_delay,
                 mode_transition_delay=args.mode_transition_delay,
                 render_console=args.console,
                 console_verbose=args.console_verbose,
+                hw_drain=args.hw_drain,
+                background_writer=args.background_writer,
+                low_latency=args.low_latency,
             )
         else:
             display = CD5220.create_simulator_only(
-                debug=args.verbose,
+                debug=False,
                 base_command_delay=args.base_command_delay,
                 mode_transition_delay=args.mode_transition_delay,
                 render_console=args.console,
@@ -450,11 +666,14 @@ def main():
             logger.info("Display initialized")
             run_comprehensive_demo(display, args)
             logger.info("Demo completed successfully!")
+        if recorder is not None:
+            recorder.save(args.record)
+            logger.info("Recorded %d writes to %s", len(recorder.writes), args.record)
             
     except CD5220DisplayError as e:
-        logger.error(f"Display error: {e}")
+        logger.error("Display error: %s", e)
     except serial.SerialException as e:
-        logger.error(f"Serial error: {e}")
+        logger.error("Serial error: %s", e)
     except KeyboardInterrupt:
         logger.info("Demo interrupted by user")
     except Exception as e:
@@ -209,3 +209,32 @@ def test_console_verbose_frames(display_console_verbose, capsys):
     out2 = capsys.readouterr().out
     assert "[non-visual]" in out2
     assert "--------------------" in out2  # frame re-rendered
+
+
+def test_string_mode_non_ascii_keeps_full_width(display):
+    sim = display.simulator
+    display.write_upper_line("CAFÉ OPEN")
+    sim.assert_line_equals(1, "CAF? OPEN")
+    assert sim.current_mode == DisplayMode.STRING
+
+
+def test_skipped_positioned_write_keeps_cursor(display):
+    sim = display.simulator
+    display.write_positioned("AB", 1, 1)
+    display.write_positioned("AB", 1, 1)  # unchanged, not transmitted
+    display.write_at_cursor("C")
+    sim.assert_line_equals(1, "ABC")
+
+
+def test_unsupported_characters_render_as_placeholder(display):
+    sim = display.simulator
+    display.write_positioned("A\tB\u00e9", 1, 1)
+    sim.assert_line_equals(1, "A?B?")
+
+
+def test_write_lines_lower_only(display):
+    sim = display.simulator
+    display.write_both_lines("KEEP", "OLD")
+    display.write_lines({2: "NEW"})
+    sim.assert_line_equals(1, "KEEP")
+    sim.assert_line_equals(2, "NEW")
@@ -6,10 +6,14 @@ actual hardware. These tests focus on parameter validation, state management,
 window management, and error handling.
 """
 
+import io
+import logging
 import pytest
 from cd5220 import serial
+import sys
+import threading
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, mock_open
 from cd5220 import CD5220, DisplayMode, CD5220DisplayError, DiffAnimator
 
 class TestCD5220Unit:
@@ -161,6 +165,17 @@ class TestCD5220Unit:
         mock_display.clear_window(1)
         assert mock_display.active_window is None
     
+    def test_clear_all_windows_single_write(self, mock_display):
+        """Both window cancels are sent together."""
+        mock_display.set_window(2, 3, 8)
+        mock_display.ser.write.reset_mock()
+        mock_display.clear_all_windows()
+        mock_display.ser.write.assert_called_once_with(
+            CD5220.CMD_WINDOW_SET + bytes([0, 0, 0, 1])
+            + CD5220.CMD_WINDOW_SET + bytes([0, 0, 0, 2])
+        )
+        assert mock_display.active_window is None
+
     def test_consolidated_viewport_writing(self, mock_display):
         """Test consolidated write_viewport method with optional char_delay."""
         # Setup viewport
@@ -178,7 +193,23 @@ class TestCD5220Unit:
             assert mock_sleep.call_count == 4  # "SLOW" = 4 characters
             # Verify sleep was called with correct delay
             mock_sleep.assert_called_with(0.1)
-    
+
+    def test_viewport_char_delay_accepts_bytes(self, mock_display):
+        """Pre-encoded text is built up one byte at a time."""
+        mock_display.set_window(1, 5, 15)
+        mock_display.enter_viewport_mode()
+        mock_display.ser.write.reset_mock()
+
+        with patch('time.sleep') as mock_sleep:
+            mock_display.write_viewport(1, b"OK", char_delay=0.1)
+        assert mock_sleep.call_count == 2
+        assert mock_display.ser.write.call_args_list == [
+            ((CD5220.CMD_CURSOR_POSITION + b'\x05\x01',),),
+            ((b'O',),),
+            ((b'K',),),
+        ]
+        mock_display.simulator.assert_char_at(6, 1, 'K')
+
     def test_viewport_mode_requirements(self, mock_display):
         """Test viewport mode entry requirements."""
         # Should fail without windows
@@ -261,6 +292,54 @@ class TestCD5220Unit:
         # Verify state is STRING after all operations
         assert mock_display.current_mode == DisplayMode.STRING
     
+    def test_write_both_lines_single_write(self, mock_display):
+        """Both string-mode lines go out in one serial write."""
+        mock_display.ser.write.reset_mock()
+        mock_display.write_both_lines("UP", "DOWN")
+        mock_display.ser.write.assert_called_once_with(
+            CD5220.CMD_STRING_UPPER + b"UP".ljust(20) + b"\x0D"
+            + CD5220.CMD_STRING_LOWER + b"DOWN".ljust(20) + b"\x0D"
+        )
+        assert mock_display.current_mode == DisplayMode.STRING
+
+    def test_string_lines_skip_unchanged_text(self, mock_display):
+        """Rewriting a string-mode line with the same text sends nothing."""
+        mock_display.write_both_lines("TEMP", "21C")
+        mock_display.ser.write.reset_mock()
+
+        mock_display.write_upper_line("TEMP")
+        mock_display.write_both_lines("TEMP", "21C")
+        mock_display.ser.write.assert_not_called()
+
+        mock_display.write_both_lines("TEMP", "22C")
+        mock_display.ser.write.assert_called_once_with(
+            mock_display._string_mode_command(CD5220.CMD_STRING_LOWER, "22C")
+        )
+
+        mock_display.ser.write.reset_mock()
+        mock_display.write_lower_line("22C", force=True)
+        mock_display.ser.write.assert_called_once()
+
+        # Leaving string mode forgets what was shown
+        mock_display.clear_display()
+        mock_display.ser.write.reset_mock()
+        mock_display.write_upper_line("TEMP")
+        mock_display.ser.write.assert_called_once()
+
+    def test_string_mode_accepts_bytes(self, mock_display):
+        """Pre-encoded text produces the same command as the str form."""
+        mock_display.ser.write.reset_mock()
+        mock_display.write_upper_line(b"HELLO\xff")
+        mock_display.ser.write.assert_called_once_with(
+            mock_display._string_mode_command(CD5220.CMD_STRING_UPPER, "HELLO?")
+        )
+        mock_display.simulator.assert_line_contains(1, "HELLO?")
+
+    def test_write_lines_validation(self, mock_display):
+        """write_lines only accepts line numbers 1 and 2."""
+        with pytest.raises(CD5220DisplayError, match="Line must be 1 or 2"):
+            mock_display.write_lines({3: "NOPE"})
+
     def test_display_info_method(self, mock_display):
         """Test display info reporting."""
         info = mock_display.get_display_info()
@@ -273,9 +352,11 @@ class TestCD5220Unit:
             'mode_transition_delay',
             'initialization_delay',
             'active_window',
+            'baudrate',
         ]
         for key in expected_keys:
             assert key in info
+        assert info['baudrate'] == 9600
         
         assert info['mode'] == 'normal'
         assert isinstance(info['auto_clear'], bool)
@@ -301,9 +382,26 @@ class TestCD5220Unit:
         assert mock_display.current_mode == DisplayMode.NORMAL
         assert mock_display.active_window is None
     
+    def test_restore_defaults_single_write(self, mock_display):
+        """Restoring defaults sends one write and settles once."""
+        mock_display.mode_transition_delay = 0.1
+        mock_display.set_brightness(1)
+        mock_display.ser.write.reset_mock()
+        with patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', return_value=100.0):
+            mock_display.restore_defaults()
+        mock_display.ser.write.assert_called_once_with(
+            CD5220.CMD_CLEAR + CD5220.CMD_BRIGHTNESS + b'\x04'
+            + CD5220.CMD_OVERWRITE_MODE + CD5220.CMD_CURSOR_OFF
+        )
+        mock_sleep.assert_called_once_with(0.1)
+        mock_display.simulator.assert_brightness(4)
+
     def test_send_command_delay_override(self, mock_display):
         """Test _send_command delay override system."""
-        with patch('time.sleep') as mock_sleep:
+        # Freeze the clock so the full settle delay remains after the write
+        with patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', return_value=100.0):
             # Test default delay (should be 0.0)
             mock_display._send_command(b'test', "Test command")
             mock_sleep.assert_not_called()  # No sleep for 0.0 delay
@@ -320,12 +418,188 @@ class TestCD5220Unit:
             mock_display._send_command(b'test', "Test command")
             mock_sleep.assert_called_once_with(0.05)
     
+    def test_delay_counts_from_write(self, mock_display):
+        """Time spent after the write is subtracted from the settle delay."""
+        with patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', side_effect=[100.0, 100.25]):
+            mock_display._send_command(b'test', "Test command", delay=0.3)
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.05)
+
+        with patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', side_effect=[100.0, 100.5]):
+            mock_display._send_command(b'test', "Test command", delay=0.3)
+        mock_sleep.assert_not_called()
+
+    def test_replacing_serial_rebinds_writes(self, mock_display):
+        """Assigning a new port sends subsequent commands through it."""
+        old_port = mock_display.ser
+        new_port = MagicMock()
+        mock_display.ser = new_port
+        mock_display.cursor_on()
+        new_port.write.assert_called_once_with(CD5220.CMD_CURSOR_ON)
+        assert CD5220.CMD_CURSOR_ON not in [c.args[0] for c in old_port.write.call_args_list]
+
+    def test_flush_is_opt_in(self, mock_display):
+        """Writes do not block on UART drain unless hw_drain is enabled."""
+        mock_display.ser.flush.reset_mock()
+        mock_display._send_command(b'test', "Test command")
+        mock_display.ser.flush.assert_not_called()
+
+        # Clearing is a sync point and always drains
+        mock_display.clear_display()
+        mock_display.ser.flush.assert_called_once()
+        mock_display.ser.flush.reset_mock()
+
+        mock_display.hw_drain = True
+        mock_display._send_command(b'test', "Test command")
+        mock_display.ser.flush.assert_called_once()
+
+    def test_tx_high_water_waits_for_backlog(self, mock_display):
+        """A full transmit buffer delays the write by its drain time."""
+        mock_display.ser.out_waiting = 96
+        with patch('time.sleep') as mock_sleep:
+            mock_display._send_command(b'test', "Test command", delay=0.0)
+            mock_sleep.assert_not_called()
+
+            mock_display.tx_high_water = 64
+            mock_display._send_command(b'test', "Test command", delay=0.0)
+            mock_sleep.assert_called_once_with(96 * 10 / 9600)
+        mock_display.ser.write.assert_called_with(b'test')
+
+    def test_scroll_marquee_skips_same_text(self, mock_display):
+        """Re-sending the scrolling text does not restart the marquee."""
+        mock_display.scroll_marquee("NEWS")
+        mock_display.ser.write.reset_mock()
+
+        mock_display.scroll_marquee("NEWS")
+        mock_display.ser.write.assert_not_called()
+
+        mock_display.clear_display()
+        mock_display.ser.write.reset_mock()
+        mock_display.scroll_marquee("NEWS")
+        mock_display.ser.write.assert_called_once()
+
+    def test_write_positioned_skips_unchanged_text(self, mock_display):
+        """Identical positioned writes are only transmitted once."""
+        mock_display.write_positioned("12:00", 1, 1)
+        mock_display.ser.write.reset_mock()
+
+        mock_display.write_positioned("12:00", 1, 1)
+        mock_display.ser.write.assert_not_called()
+
+        # Overlapping write invalidates the remembered text
+        mock_display.write_positioned("X", 3, 1)
+        mock_display.ser.write.reset_mock()
+        mock_display.write_positioned("12:00", 1, 1)
+        assert mock_display.ser.write.called
+
+        mock_display.ser.write.reset_mock()
+        mock_display.force_redraw()
+        mock_display.write_positioned("12:00", 1, 1)
+        assert mock_display.ser.write.called
+
+    def test_skipped_write_restores_cursor_only_when_needed(self, mock_display):
+        """A skipped write owes its cursor move only to cursor-relative commands."""
+        mock_display.write_positioned("A", 1, 1)
+        mock_display.write_positioned("A", 1, 1)
+        mock_display.ser.write.reset_mock()
+
+        mock_display.write_positioned("B", 5, 1)
+        assert mock_display.ser.write.call_args_list == [
+            ((CD5220.CMD_CURSOR_POSITION + b'\x05\x01B',),),
+        ]
+
+        mock_display.write_positioned("B", 5, 1)
+        mock_display.ser.write.reset_mock()
+        mock_display.write_at_cursor("C")
+        mock_display.cursor_move_left()
+        assert mock_display.ser.write.call_args_list == [
+            ((CD5220.CMD_CURSOR_POSITION + b'\x06\x01C',),),
+            ((CD5220.CMD_CURSOR_LEFT,),),
+        ]
+        mock_display.simulator.assert_char_at(6, 1, 'C')
+
+        mock_display.write_positioned("D", 1, 2)
+        mock_display.write_positioned("D", 1, 2)
+        mock_display.clear_display()
+        mock_display.ser.write.reset_mock()
+        mock_display.write_at_cursor("E")
+        mock_display.ser.write.assert_called_once_with(b'E')
+
+    def test_write_positioned_single_write(self, mock_display):
+        """Cursor positioning and text share one serial write."""
+        mock_display.ser.write.reset_mock()
+        mock_display.write_positioned("HI", 3, 2)
+        mock_display.ser.write.assert_called_once_with(CD5220.CMD_CURSOR_POSITION + b'\x03\x02HI')
+        mock_display.simulator.assert_char_at(3, 2, 'H')
+        mock_display.simulator.assert_char_at(4, 2, 'I')
+
+    def test_batch_sends_one_write(self, mock_display):
+        """Commands inside batch() go out together when the block exits."""
+        mock_display.ser.write.reset_mock()
+        with patch('time.sleep') as mock_sleep:
+            with mock_display.batch():
+                mock_display.write_positioned("AB", 1, 1)
+                with mock_display.batch():
+                    mock_display.write_positioned("CD", 1, 2, delay=0.2)
+                mock_display.cursor_on(delay=0.1)
+                mock_display.ser.write.assert_not_called()
+                mock_display.simulator.assert_char_at(1, 2, 'C')
+            mock_sleep.assert_called_once_with(0.2)
+        mock_display.ser.write.assert_called_once_with(
+            CD5220.CMD_CURSOR_POSITION + b'\x01\x01AB'
+            + CD5220.CMD_CURSOR_POSITION + b'\x01\x02CD'
+            + CD5220.CMD_CURSOR_ON
+        )
+
+    def test_display_message_single_write(self, mock_display):
+        """Both display_message modes send the message in one write."""
+        with patch('time.sleep'):
+            mock_display.ser.write.reset_mock()
+            mock_display.display_message("HELLO", duration=0.0, mode="normal")
+            mock_display.ser.write.assert_called_once_with(
+                CD5220.CMD_CLEAR + CD5220.CMD_CURSOR_POSITION + b'\x01\x01HELLO'
+            )
+
+            # A message filling both lines needs no clear in normal mode
+            mock_display.ser.write.reset_mock()
+            mock_display.display_message("B" * 40, duration=0.0, mode="normal")
+            assert not mock_display.ser.write.call_args.args[0].startswith(CD5220.CMD_CLEAR)
+
+            mock_display.ser.write.reset_mock()
+            mock_display.display_message("A" * 25, duration=0.0)
+            mock_display.ser.write.assert_called_once()
+        mock_display.simulator.assert_line_contains(2, "AAAAA")
+
+    def test_display_message_full_width_clears_window(self, mock_display):
+        """A window set in normal mode is still cleared by a full-width message."""
+        mock_display.set_window(1, 5, 10)
+        with patch('time.sleep'):
+            mock_display.ser.write.reset_mock()
+            mock_display.display_message("B" * 40, duration=0.0, mode="normal")
+        assert mock_display.ser.write.call_args.args[0].startswith(CD5220.CMD_CLEAR)
+        assert mock_display.active_window is None
+        mock_display.simulator.assert_line_contains(1, "B" * 20)
+
+    def test_write_positioned_checks_mode_once(self, mock_display):
+        """Positioned writes validate and guard the mode a single time."""
+        with pytest.raises(CD5220DisplayError, match="Column must be 1-20"):
+            mock_display.write_positioned("A", 21, 1)
+
+        mock_display.write_upper_line("STRING")
+        with patch.object(mock_display, '_transition_to_normal',
+                          wraps=mock_display._transition_to_normal) as guard:
+            mock_display.write_positioned("A", 1, 1)
+        guard.assert_called_once()
+        assert mock_display.current_mode == DisplayMode.NORMAL
+
     def test_mode_transition_delays(self, mock_display):
         """Test mode transition delay system."""
         # Set custom mode transition delay
         mock_display.mode_transition_delay = 0.1
         
-        with patch('time.sleep') as mock_sleep:
+        with patch('time.sleep') as mock_sleep, \
+             patch('time.monotonic', return_value=100.0):
             # Mode transition methods should use mode_transition_delay
             mock_display.set_overwrite_mode()
             mock_sleep.assert_called_with(0.1)
@@ -397,6 +671,151 @@ class TestCD5220Unit:
         assert cleared is True
         assert mock_display.current_mode == DisplayMode.NORMAL
 
+    def test_init_sequence_settles_before_defaults(self):
+        """ESC @ goes out alone and settles; the defaults follow in one write."""
+        events = []
+        with patch('cd5220.serial.Serial') as mock_serial, \
+             patch('time.monotonic', return_value=100.0), \
+             patch('time.sleep', side_effect=lambda s: events.append(s)):
+            mock_serial.return_value.is_open = True
+            mock_serial.return_value.write.side_effect = events.append
+            display = CD5220('mock', debug=False, initialization_delay=0.3)
+            assert events[-3:] == [
+                CD5220.CMD_INITIALIZE,
+                0.3,
+                CD5220.CMD_CLEAR + CD5220.CMD_BRIGHTNESS + b'\x04'
+                + CD5220.CMD_OVERWRITE_MODE + CD5220.CMD_CURSOR_OFF,
+            ]
+            assert display.current_mode == DisplayMode.NORMAL
+            display.simulator.assert_brightness(4)
+            display.simulator.assert_cursor_visible(False)
+
+    def test_initialize_settles_before_clear(self, mock_display):
+        """initialize() waits out the reset before clearing."""
+        events = []
+        mock_display.ser.write.side_effect = events.append
+        with patch('time.monotonic', return_value=100.0), \
+             patch('time.sleep', side_effect=lambda s: events.append(s)):
+            mock_display.initialize(delay=0.4)
+        assert events == [CD5220.CMD_INITIALIZE, 0.4, CD5220.CMD_CLEAR]
+        assert mock_display.current_mode == DisplayMode.NORMAL
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Linux serial flag")
+    def test_low_latency_sets_serial_flag(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            CD5220('mock', debug=False, low_latency=True)
+        mock_serial.return_value.set_low_latency_mode.assert_called_once_with(True)
+        with patch('cd5220.serial.Serial') as mock_serial, \
+             patch('cd5220.open', mock_open(), create=True) as opened:
+            mock_serial.return_value.port = '/dev/ttyUSB0'
+            CD5220('mock', debug=False, low_latency=True)
+        opened.assert_not_called()  # the sysfs timer is only a fallback
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Linux sysfs")
+    def test_low_latency_lowers_usb_latency_timer(self):
+        port = Mock(spec=['write', 'flush', 'close', 'is_open', 'port'])
+        port.port = '/dev/ttyUSB0'
+        with patch('cd5220.open', mock_open(), create=True) as opened:
+            CD5220(port, debug=False, low_latency=True)
+        opened.assert_called_once_with('/sys/bus/usb-serial/devices/ttyUSB0/latency_timer', 'w')
+        opened().write.assert_called_once_with('1')
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="Linux sysfs")
+    def test_low_latency_warns_when_nothing_applies(self, caplog):
+        port = Mock(spec=['write', 'flush', 'close', 'is_open', 'port'])
+        port.port = '/dev/ttyS0'
+        with patch('cd5220.open', side_effect=FileNotFoundError, create=True), \
+             caplog.at_level(logging.DEBUG, logger='CD5220'):
+            CD5220(port, debug=False, low_latency=True)
+        messages = [(r.levelno, r.getMessage()) for r in caplog.records]
+        assert (logging.WARNING, "Could not enable low-latency mode") in messages
+        assert any(level == logging.DEBUG and "ttyS0/latency_timer" in msg
+                   for level, msg in messages)
+
+    def test_tx_buffer_size_requested_when_supported(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            CD5220('mock', debug=False, tx_buffer_size=4096)
+            mock_serial.return_value.set_buffer_size.assert_called_once_with(tx_size=4096)
+        port = Mock(spec=['write', 'flush', 'close', 'is_open'])
+        CD5220(port, debug=False, tx_buffer_size=4096)  # POSIX ports: ignored
+
+    def test_debug_logging_handler_attached_once(self):
+        lib_logger = logging.getLogger('CD5220')
+        level, propagate = lib_logger.level, lib_logger.propagate
+
+        debug_logger = logging.getLogger('CD5220.debug')
+
+        def streams():
+            return [h for h in debug_logger.handlers if type(h) is logging.StreamHandler]
+
+        before = len(streams())
+        first = CD5220.create_simulator_only(debug=True)
+        second = CD5220.create_simulator_only(debug=True)
+        assert len(streams()) == max(before, 1)
+        first.close()
+        assert len(streams()) == max(before, 1)  # still held by the second display
+        second.close()
+        assert len(streams()) == before
+        assert (lib_logger.level, lib_logger.propagate) == (level, propagate)
+
+    def test_debug_display_does_not_capture_warnings(self):
+        records = []
+        sink = logging.Handler()
+        sink.emit = records.append
+        root = logging.getLogger()
+        root.addHandler(sink)
+        try:
+            display = CD5220.create_simulator_only(debug=True)
+            display.write_upper_line("STRING")
+            display.cursor_on()  # auto-clear warning
+            display.close()
+        finally:
+            root.removeHandler(sink)
+        assert any(r.levelno == logging.WARNING and r.name == 'CD5220.debug' for r in records)
+
+    def test_debug_level_of_other_display_is_not_inherited(self):
+        lib_logger = logging.getLogger('CD5220')
+        level = lib_logger.level
+        debug_display = CD5220.create_simulator_only(debug=True)
+        try:
+            assert lib_logger.level == level
+            display = CD5220.create_simulator_only(debug=False)
+            assert display._debug_enabled == lib_logger.isEnabledFor(logging.DEBUG)
+        finally:
+            debug_display.close()
+
+    def test_debug_ring_buffers_until_close(self):
+        display = CD5220.create_simulator_only(debug=True, debug_ring_size=3)
+        ring = display.debug_ring
+        for _ in range(5):
+            display.cursor_on()
+        assert len(ring.records) == 3
+        out = io.StringIO()
+        ring.dump(out)
+        assert out.getvalue().count("[CD5220] Sending: Cursor on") == 3
+        assert not ring.records
+        display.close()
+        assert ring not in logging.getLogger('CD5220.debug').handlers
+
+    def test_debug_ring_leaves_propagation_alone(self):
+        records = []
+        sink = logging.Handler()  # level NOTSET, like basicConfig's handler
+        sink.emit = records.append
+        root = logging.getLogger()
+        root.addHandler(sink)
+        try:
+            display = CD5220.create_simulator_only(debug=True, debug_ring_size=10)
+            ring = display.debug_ring
+            display.write_upper_line("STRING")
+            display.cursor_on()  # auto-clear warning
+            assert any(r.levelno == logging.WARNING for r in ring.records)
+            assert any(r.levelno == logging.WARNING and r.name == 'CD5220.debug' for r in records)
+            display.close()
+            assert display.debug_ring is None
+            assert logging.getLogger('CD5220').propagate is True
+        finally:
+            root.removeHandler(sink)
+
     def test_init_with_existing_serial(self):
         with patch('cd5220.serial.Serial') as mock_serial:
             mock_serial.return_value.is_open = True
@@ -411,6 +830,13 @@ class TestCD5220Unit:
         out = capsys.readouterr().out
         assert "desc" in out or out
 
+    def test_render_console_formats_description_args(self, capsys):
+        display = CD5220(debug=False, enable_simulator=True, render_console=True,
+                         console_verbose=True)
+        capsys.readouterr()
+        display.set_brightness(2)
+        assert "Set brightness: 2" in capsys.readouterr().out
+
     def test_cursor_movement_commands(self, mock_display):
         """Cursor movement helpers update simulator coordinates."""
         mock_display.cursor_move_right()
@@ -432,6 +858,76 @@ class TestCD5220Unit:
                 disp._ensure_normal_mode('write')
         
 
+class TestCD5220BackgroundWriter:
+    """Tests for the optional writer thread."""
+
+    def test_writes_are_queued_and_drained(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            mock_serial.return_value.is_open = True
+            display = CD5220('mock', debug=False, background_writer=True)
+            display.ser.write.reset_mock()
+            display.write_positioned("HI", 1, 1)
+            display.cursor_on()
+            display.wait_idle()
+            sent = b''.join(c.args[0] for c in display.ser.write.call_args_list)
+            assert sent == CD5220.CMD_CURSOR_POSITION + b'\x01\x01HI' + CD5220.CMD_CURSOR_ON
+            display.close()
+            assert display._writer_thread is None
+
+    def test_writer_errors_surface_on_caller(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            mock_serial.return_value.is_open = True
+            display = CD5220('mock', debug=False, background_writer=True)
+            display.ser.write.side_effect = serial.SerialException("Write failed")
+            display.cursor_on()
+            with pytest.raises(CD5220DisplayError, match="Command failed"):
+                display.wait_idle()
+            display.close()
+
+    def test_writer_survives_non_serial_errors(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            mock_serial.return_value.is_open = True
+            display = CD5220('mock', debug=False, background_writer=True)
+            display.ser.write.side_effect = OSError("device unplugged")
+            display.cursor_on()
+            with pytest.raises(CD5220DisplayError, match="device unplugged"):
+                display.wait_idle()
+            assert display._writer_thread.is_alive()
+            display.ser.write.side_effect = None
+            display.cursor_off()
+            display.wait_idle()
+            display.close()
+
+    def test_dead_writer_raises_instead_of_blocking(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            mock_serial.return_value.is_open = True
+            display = CD5220('mock', debug=False, background_writer=True)
+            display._writer_queue.put(None)  # writer exits as if it had crashed
+            display._writer_thread.join()
+            with pytest.raises(CD5220DisplayError, match="writer has stopped"):
+                display.cursor_on()
+            with pytest.raises(CD5220DisplayError, match="writer has stopped"):
+                display.wait_idle()
+
+    def test_viewport_char_delay_paced_by_writer(self):
+        with patch('cd5220.serial.Serial') as mock_serial:
+            mock_serial.return_value.is_open = True
+            display = CD5220('mock', debug=False, background_writer=True)
+            display.set_window(1, 5, 15)
+            display.enter_viewport_mode()
+            display.wait_idle()
+            display.ser.write.reset_mock()
+            sleepers = []
+            with patch('time.sleep', side_effect=lambda _: sleepers.append(threading.current_thread())):
+                display.write_viewport(1, "SLOW", char_delay=0.1)
+                display.wait_idle()
+            sent = b''.join(c.args[0] for c in display.ser.write.call_args_list)
+            assert sent == CD5220.CMD_CURSOR_POSITION + b'\x05\x01SLOW'
+            assert len(sleepers) == 4
+            assert threading.current_thread() not in sleepers
+            display.close()
+
+
 class TestCD5220ErrorHandling:
     """Test error handling scenarios."""
     
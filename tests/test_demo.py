@@ -1,3 +1,6 @@
+import logging.handlers
+import os
+import sys
 import pytest
 from unittest.mock import MagicMock, patch
 import demo
@@ -18,3 +21,178 @@ def test_demo_ascii_invokes_all(monkeypatch, mock_display):
     fake_anim.play_startup_sequence.assert_called_once()
     fake_anim.play_demo_cycle.assert_called_once()
     mock_display.write_both_lines.assert_any_call('DEMO: ASCII ANIM', 'STARTING...')
+
+
+def test_fixture_pause_waits_for_queued_writes(mock_display):
+    fixture = demo.CD5220DemoFixture(mock_display, 0.0)
+    with patch('time.sleep'):
+        fixture.pause_for_observation("queued", 0.0)
+    mock_display.wait_idle.assert_called_once()
+
+
+def test_viewport_demo_batches_setup(mock_display):
+    with patch('time.sleep'):
+        demo.demo_viewport_mode(mock_display, 0.0)
+    assert mock_display.batch.call_count == 2
+    mock_display.set_window.assert_any_call(1, 5, 16)
+
+
+@pytest.mark.parametrize("demo_func", [demo.demo_viewport_mode, demo.demo_convenience_features])
+def test_observation_pause_starts_after_character_building(mock_display, demo_func):
+    with patch('time.sleep'):
+        demo_func(mock_display, 0.0)
+    calls = mock_display.mock_calls
+    built = [i for i, c in enumerate(calls)
+             if c[0] == 'write_viewport' and c[2].get('char_delay') is not None]
+    assert built
+    assert all(calls[i + 1][0] == 'wait_idle' for i in built)
+
+
+def test_fixture_wait_reclaims_timer_jitter(mock_display):
+    with patch('time.monotonic', return_value=100.0):
+        fixture = demo.CD5220DemoFixture(mock_display, 1.0)
+    with patch('time.monotonic', side_effect=[100.0, 101.01]), \
+         patch('time.sleep') as ts:
+        fixture.wait(1.0)
+        fixture.wait(1.0)
+    assert ts.call_args_list[0][0][0] == pytest.approx(1.0)
+    assert ts.call_args_list[1][0][0] == pytest.approx(0.99)
+
+
+def test_normal_mode_demo_walks_brightness_levels(mock_display):
+    with patch('time.sleep'):
+        demo.demo_normal_mode_features(mock_display, 0.0)
+    levels = [c[0][0] for c in mock_display.set_brightness.call_args_list]
+    assert levels == [1, 2, 3, 4]
+    mock_display.write_both_lines.assert_any_call("BRIGHTNESS TEST", "LEVEL: 4/4 (MAX)")
+
+
+def test_wait_for_enter_falls_back_to_input(monkeypatch):
+    monkeypatch.setattr(demo.sys, 'stdin', object())
+    with patch('builtins.input') as fake_input:
+        demo.wait_for_enter("Press Enter to continue...")
+    fake_input.assert_called_once_with("Press Enter to continue...")
+
+
+@pytest.mark.skipif(sys.platform.startswith('win'), reason="pipes are not selectable on Windows")
+def test_wait_for_enter_runs_keepalive_until_enter(monkeypatch, capsys):
+    read_fd, write_fd = os.pipe()
+    stdin = os.fdopen(read_fd)
+    monkeypatch.setattr(demo.sys, 'stdin', stdin)
+    calls = []
+
+    def keepalive():
+        calls.append(1)
+        os.write(write_fd, b"\n")
+
+    try:
+        demo.wait_for_enter("Press Enter", keepalive=keepalive, interval=0.01)
+    finally:
+        stdin.close()
+        os.close(write_fd)
+    assert calls == [1]
+    assert "Press Enter" in capsys.readouterr().out
+
+
+def test_record_and_replay_round_trip(tmp_path):
+    recorder = demo.RecordingPort()
+    with patch('time.sleep'):
+        display = CD5220(recorder, debug=False)
+        display.write_positioned("HI", 1, 1)
+    path = str(tmp_path / "run.json")
+    recorder.save(path)
+
+    port = MagicMock()
+    with patch('time.sleep'):
+        demo.replay_recording(port, path)
+    replayed = b''.join(c[0][0] for c in port.write.call_args_list)
+    assert replayed == b''.join(data for _, data in recorder.writes)
+    assert replayed.endswith(CD5220.CMD_CURSOR_POSITION + b'\x01\x01HI')
+
+
+def test_demo_reuses_passed_fixture(monkeypatch, mock_display):
+    fixture = demo.CD5220DemoFixture(mock_display, 0.0)
+    created = []
+    monkeypatch.setattr(demo, "CD5220DemoFixture", lambda *a: created.append(a))
+    with patch('time.sleep'):
+        demo.demo_string_mode_features(mock_display, 0.0, fixture=fixture)
+    assert created == []
+
+
+def test_fixture_wait_keeps_loop_cadence(mock_display):
+    with patch('time.monotonic', return_value=100.0):
+        fixture = demo.CD5220DemoFixture(mock_display, 1.0)
+    # Each step's writes take 20 ms before the wait starts
+    with patch('time.monotonic', side_effect=[100.02, 100.52, 101.02]), \
+         patch('time.sleep') as ts:
+        for _ in range(3):
+            fixture.wait(fixture.CURSOR_STEP_PAUSE)
+    # Write time comes out of the pause, so steps land every 0.5 s
+    assert [c[0][0] for c in ts.call_args_list] == pytest.approx([0.48, 0.48, 0.48])
+
+
+def test_all_demos_follow_suite_order():
+    assert demo.ALL_DEMOS[:3] == demo.DEMO_SUITES['core']
+    assert demo.ALL_DEMOS[-1] is demo.demo_ascii_animations
+    assert len(demo.ALL_DEMOS) == sum(len(s) for s in demo.DEMO_SUITES.values())
+
+
+def test_shared_fixture_skips_reset_after_teardown(mock_display):
+    fixture = demo.CD5220DemoFixture(mock_display, 0.0)
+    with patch('time.sleep'):
+        demo.demo_string_mode_features(mock_display, 0.0, fixture=fixture)
+        demo.demo_smart_mode_management(mock_display, 0.0, fixture=fixture)
+    # first setup, two teardowns; the second setup relies on the teardown
+    assert mock_display.restore_defaults.call_count == 3
+
+
+def test_finale_is_a_single_write():
+    from types import SimpleNamespace
+    with patch('cd5220.serial.Serial') as mock_serial, patch('time.sleep'):
+        display = CD5220('mock', debug=False)
+        config = SimpleNamespace(demo='config', delay_multiplier=0.0, auto_advance=True)
+        with patch.object(demo, 'DEMO_SUITES', {'config': (), 'core': ()}):
+            display.ser.write.reset_mock()
+            demo.run_comprehensive_demo(display, config)
+    last = mock_serial.return_value.write.call_args_list[-1][0][0]
+    assert last.startswith(CD5220.CMD_CLEAR)
+    assert b'ALL DEMOS' in last and b'COMPLETED!' in last
+    display.simulator.assert_line_contains(1, 'ALL DEMOS')
+
+
+def test_log_in_background_routes_through_queue():
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    records = []
+    sink = logging.Handler()
+    sink.emit = records.append
+    root.handlers[:] = [sink]
+    try:
+        with patch('atexit.register'):
+            listener = demo.log_in_background()
+        assert [type(h) for h in root.handlers] == [logging.handlers.QueueHandler]
+        demo.logger.warning("queued %s", "message")
+        listener.stop()
+    finally:
+        root.handlers[:] = saved
+    assert [r.getMessage() for r in records] == ["queued message"]
+
+
+def test_library_debug_records_reach_the_log_queue():
+    root = logging.getLogger()
+    lib_logger = logging.getLogger('CD5220')
+    saved = root.handlers[:], lib_logger.level
+    records = []
+    sink = logging.Handler()
+    sink.emit = records.append
+    root.handlers[:] = [sink]
+    try:
+        with patch('atexit.register'):
+            listener = demo.log_in_background()
+        lib_logger.setLevel(logging.DEBUG)  # what --verbose does
+        CD5220.create_simulator_only(debug=False).cursor_on()
+        listener.stop()
+    finally:
+        root.handlers[:] = saved[0]
+        lib_logger.setLevel(saved[1])
+    assert any(r.getMessage().startswith("Sending: Cursor on") for r in records)